@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Export the NER token classifier to int8-quantized ONNX.
+
+Produces models/nlp_models/ner_onnx_int8, consumed by
+src.nlp.onnx_ner.OnnxMedicalNER when NLP_BACKEND=onnx-int8.
+
+Usage:
+    python scripts/export_ner_onnx.py [--model <hf-name-or-path>]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+MODEL_DIR = Path("./models/nlp_models")
+DEFAULT_MODEL = "d4data/biomedical-ner-all"
+
+
+def export_int8(model_name: str, output_dir: Path) -> bool:
+    """Export the model to ONNX and dynamically quantize it to int8."""
+    try:
+        from optimum.onnxruntime import (
+            ORTModelForTokenClassification,
+            ORTQuantizer,
+        )
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+    except ImportError:
+        logger.error(
+            "optimum[onnxruntime] is required: pip install optimum[onnxruntime]"
+        )
+        return False
+
+    try:
+        export_dir = output_dir / "ner_onnx_fp32"
+        quantized_dir = output_dir / "ner_onnx_int8"
+
+        logger.info(f"Exporting {model_name} to ONNX...")
+        model = ORTModelForTokenClassification.from_pretrained(
+            model_name, export=True
+        )
+        model.save_pretrained(export_dir)
+
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        tokenizer.save_pretrained(export_dir)
+        tokenizer.save_pretrained(quantized_dir)
+
+        logger.info("Quantizing weights to int8 (dynamic)...")
+        quantizer = ORTQuantizer.from_pretrained(export_dir)
+        quantizer.quantize(
+            save_dir=quantized_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(
+                is_static=False, per_channel=False
+            ),
+        )
+
+        logger.info(f"✅ int8 model ready at {quantized_dir}")
+        return True
+
+    except Exception as e:
+        logger.error(f"ONNX export failed: {e}")
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--model",
+        default=DEFAULT_MODEL,
+        help="Token-classification model to export",
+    )
+    args = parser.parse_args()
+
+    MODEL_DIR.mkdir(parents=True, exist_ok=True)
+    ok = export_int8(args.model, MODEL_DIR)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Async micro-batching for NLP request coalescing.
+
+BRANCH-6: REST API
+"""
+
+import asyncio
+from typing import List, Tuple
+
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class NLPBatcher:
+    """Coalesce in-flight process-message requests into model batches.
+
+    Requests arriving within the batching window (or until the batch
+    fills) are processed with one processor.process_batch call instead
+    of N single-message calls; each caller awaits its own future. The
+    batch itself runs in the default executor so the event loop stays
+    responsive while the models work.
+    """
+
+    def __init__(
+        self,
+        processor,
+        max_batch_size: int = 32,
+        window_ms: float = 10.0
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            processor: MedicalMessageProcessor (or compatible)
+            max_batch_size: Flush as soon as this many requests queue up
+            window_ms: Max time a request waits for batch-mates
+        """
+        self.processor = processor
+        self.max_batch_size = max_batch_size
+        self.window = window_ms / 1000.0
+        self._queue: List[Tuple[str, asyncio.Future]] = []
+        self._window_task = None
+
+    async def enqueue(self, text: str):
+        """Queue one text and await its ProcessedMessage."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((text, future))
+
+        if len(self._queue) >= self.max_batch_size:
+            if self._window_task is not None:
+                self._window_task.cancel()
+                self._window_task = None
+            await self._flush()
+        elif self._window_task is None:
+            self._window_task = loop.create_task(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self):
+        """Let the batching window elapse, then flush what queued up."""
+        try:
+            await asyncio.sleep(self.window)
+        except asyncio.CancelledError:
+            return
+        self._window_task = None
+        await self._flush()
+
+    async def _flush(self):
+        """Process everything queued and fan results back to callers."""
+        batch, self._queue = self._queue, []
+        if not batch:
+            return
+
+        texts = [text for text, _ in batch]
+        loop = asyncio.get_running_loop()
+        logger.debug(f"Flushing NLP batch of {len(batch)} requests")
+
+        try:
+            results = await loop.run_in_executor(
+                None, self.processor.process_batch, texts
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -7,10 +7,19 @@ Author: Boris (Claude Code)
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson  # noqa: F401 — ORJSONResponse needs it at render time
+    from fastapi.responses import ORJSONResponse
+    DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    DEFAULT_RESPONSE_CLASS = JSONResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from contextlib import asynccontextmanager
 
+from src.api.batching import NLPBatcher
 from src.core.config import get_settings
 from src.core.logger import get_logger
 from src.nlp.message_processor import MedicalMessageProcessor
@@ -24,9 +33,11 @@ async def lifespan(app: FastAPI):
     # Load the ML model when the app starts
     logger.info("Loading NLP models...")
     app.state.processor = MedicalMessageProcessor()
+    app.state.batcher = NLPBatcher(app.state.processor)
     yield
     # Clean up the ML model and release resources on shutdown
     logger.info("Cleaning up NLP models...")
+    del app.state.batcher
     del app.state.processor
 
 # ============================================================================
@@ -133,6 +144,7 @@ def create_app() -> FastAPI:
         version=settings.app_version,
         docs_url="/api/docs",
         openapi_url="/api/openapi.json",
+        default_response_class=DEFAULT_RESPONSE_CLASS,
         lifespan=lifespan
     )
 
@@ -218,7 +230,8 @@ def create_app() -> FastAPI:
         try:
             logger.info(f"Processing message: {request.text[:100]}...")
 
-            result = app.state.processor.process_message(request.text)
+            # Coalesce concurrent requests into one model batch
+            result = await app.state.batcher.enqueue(request.text)
 
             if result.processing_status == "error":
                 raise HTTPException(
@@ -273,7 +286,7 @@ def create_app() -> FastAPI:
         try:
             logger.debug(f"Extracting entities from text")
 
-            result = processor.process_message(text)
+            result = app.state.processor.process_message(text)
 
             # Filter by confidence
             filtered_entities = [
@@ -317,7 +330,7 @@ def create_app() -> FastAPI:
         try:
             logger.debug(f"Classifying text")
 
-            result = processor.process_message(text)
+            result = app.state.processor.process_message(text)
 
             return {
                 "text": text[:100],
@@ -376,7 +389,7 @@ def create_app() -> FastAPI:
 
             responses = []
             for request in requests:
-                result = processor.process_message(request.text)
+                result = app.state.processor.process_message(request.text)
                 responses.append(
                     ProcessMessageResponse(
                         text=result.text,
@@ -132,13 +132,22 @@ class Settings(BaseSettings):
         """Check if running in development."""
         return self.environment.lower() == "development"
 
+    @classmethod
+    def fast(cls) -> "Settings":
+        """Construct from defaults without validation.
+
+        model_construct skips env-file parsing and field validation, so
+        this is for trusted contexts (test fixtures) only.
+        """
+        return cls.model_construct()
+
     class Config:
         """Pydantic configuration."""
         env_file = ".env"
         case_sensitive = False
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get cached settings instance.
@@ -9,7 +9,7 @@ from typing import List, Optional, Any, Dict
 from datetime import datetime
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_,text
+from sqlalchemy import desc, and_, insert, text, update
 
 from src.core.logger import get_logger
 from src.database.models import Message, Channel, Entity, Product, Price
@@ -135,12 +135,24 @@ class EntityCRUD:
             raise
 
     def create_batch(self, entities: List[Dict[str, Any]]) -> int:
-        """Create multiple entities."""
+        """Create multiple entities with one bulk insert."""
         try:
-            for entity_data in entities:
-                entity = Entity(**entity_data)
-                self.session.add(entity)
+            self.session.bulk_insert_mappings(Entity, entities)
+            self._bump_product_mentions(entities)
+            self.session.commit()
+            logger.debug(f"Created {len(entities)} entities")
+            return len(entities)
 
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Error creating entities: {e}")
+            raise
+
+    def create_batch_core(self, entities: List[Dict[str, Any]]) -> int:
+        """Create multiple entities via a 2.x-style Core insert."""
+        try:
+            self.session.execute(insert(Entity), entities)
+            self._bump_product_mentions(entities)
             self.session.commit()
             logger.debug(f"Created {len(entities)} entities")
             return len(entities)
@@ -150,6 +162,25 @@ class EntityCRUD:
             logger.error(f"Error creating entities: {e}")
             raise
 
+    def _bump_product_mentions(self, entities: List[Dict[str, Any]]) -> None:
+        """Keep the denormalized product mention counters current.
+
+        Aggregates medication mentions in the batch and issues one
+        UPDATE per product, inside the caller's transaction.
+        """
+        mention_totals: Dict[str, int] = {}
+        for entity_data in entities:
+            if entity_data.get("entity_type") == "MEDICATION":
+                name = entity_data["text"]
+                mention_totals[name] = mention_totals.get(name, 0) + 1
+
+        for name, count in mention_totals.items():
+            self.session.execute(
+                update(Product)
+                .where(Product.name == name)
+                .values(mention_count=Product.mention_count + count)
+            )
+
     def get_by_message(self, message_id: int) -> List[Entity]:
         """Get entities for a message."""
         return self.session.query(Entity).filter(Entity.message_id == message_id).all()
@@ -128,6 +128,11 @@ class Product(Base):
     # Relationships
     prices = relationship("Price", back_populates="product", cascade="all, delete-orphan")
 
+    # Indexes
+    __table_args__ = (
+        Index("idx_products_mentions", mention_count.desc()),
+    )
+
     def __repr__(self):
         return f"<Product(id={self.id}, name='{self.name}')>"
 
@@ -5,15 +5,93 @@ BRANCH-3: NLP Pipeline
 Author: Boris (Claude Code)
 """
 
+import re
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import List, Optional
 
+import numpy as np
+
 from src.core.logger import get_logger
 
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+    from rapidfuzz import process as _rf_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import marisa_trie
+    MARISA_AVAILABLE = True
+except ImportError:
+    MARISA_AVAILABLE = False
+
 logger = get_logger(__name__)
 
 
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _min_edit(a, b):
+        """Levenshtein distance over two uint8 arrays."""
+        n, m = len(a), len(b)
+        prev = np.arange(m + 1)
+        curr = np.empty(m + 1, dtype=np.int64)
+        for i in range(1, n + 1):
+            curr[0] = i
+            for j in range(1, m + 1):
+                cost = 0 if a[i - 1] == b[j - 1] else 1
+                best = prev[j] + 1
+                if curr[j - 1] + 1 < best:
+                    best = curr[j - 1] + 1
+                if prev[j - 1] + cost < best:
+                    best = prev[j - 1] + cost
+                curr[j] = best
+            for j in range(m + 1):
+                prev[j] = curr[j]
+        return prev[m]
+
+    @njit(parallel=True, cache=True)
+    def _best_match_scores(query, keys_flat, offsets):
+        """Normalized edit similarity of query against flattened keys."""
+        count = len(offsets) - 1
+        scores = np.empty(count, dtype=np.float64)
+        for idx in prange(count):
+            candidate = keys_flat[offsets[idx]:offsets[idx + 1]]
+            longest = max(len(query), len(candidate))
+            if longest == 0:
+                scores[idx] = 1.0
+            else:
+                dist = _min_edit(query, candidate)
+                scores[idx] = 1.0 - dist / longest
+        return scores
+
+    # Warm-start the JIT at import so the first lookup isn't slow
+    _best_match_scores(
+        np.frombuffer(b"a", dtype=np.uint8),
+        np.frombuffer(b"ab", dtype=np.uint8),
+        np.array([0, 2], dtype=np.int64),
+    )
+
+# Precompiled once; normalization is on the hot path of every lookup
+_PUNCT_RE = re.compile(r"[^\w\s]+")
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def _normalize(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    return _WS_RE.sub(" ", _PUNCT_RE.sub("", text)).strip().lower()
+
+
 @dataclass
 class LinkingResult:
     """Result of entity linking."""
@@ -25,6 +103,11 @@ class LinkingResult:
     found: bool
     match_type: str  # "exact", "fuzzy", "partial"
 
+    @property
+    def normalized(self) -> str:
+        """Alias for the canonical form, mirroring MedicalEntity."""
+        return self.canonical
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
@@ -87,8 +170,145 @@ class MedicalEntityLinker:
         """Initialize entity linker."""
         self.medications_kb = self.MEDICATIONS_KB
         self.conditions_kb = self.CONDITIONS_KB
+        # Flattened key+alias choice lists for the fuzzy matcher,
+        # rebuilt whenever a knowledge base grows
+        self._choice_cache: dict = {}
+        self._flat_cache: dict = {}
+        self._trie_cache: dict = {}
+        # Per-instance memo so repeated tokens skip the fuzzy search;
+        # bound here rather than on the class to avoid pinning instances
+        self._link_cached = lru_cache(maxsize=65536)(self._link_uncached)
         logger.info("Entity linker initialized with knowledge bases")
 
+    def _kb_choices(self, knowledge_base: dict) -> dict:
+        """Flatten a KB's keys and aliases into one candidate map."""
+        key = (id(knowledge_base), len(knowledge_base))
+        choices = self._choice_cache.get(key)
+
+        if choices is None:
+            choices = {}
+            for kb_key, kb_data in knowledge_base.items():
+                choices[kb_key] = kb_data
+                for alias in kb_data.get("aliases", []):
+                    choices.setdefault(alias, kb_data)
+            self._choice_cache[key] = choices
+
+        return choices
+
+    def _kb_flat(self, knowledge_base: dict) -> tuple:
+        """Flatten candidate keys into uint8 arrays for the JIT scorer."""
+        key = (id(knowledge_base), len(knowledge_base))
+        entry = self._flat_cache.get(key)
+
+        if entry is None:
+            keys = list(self._kb_choices(knowledge_base))
+            encoded = [k.encode("utf-8") for k in keys]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            for i, raw in enumerate(encoded):
+                offsets[i + 1] = offsets[i] + len(raw)
+            flat = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+            entry = (keys, flat, offsets)
+            self._flat_cache[key] = entry
+
+        return entry
+
+    def _kb_trie(self, knowledge_base: dict):
+        """Frozen marisa trie over candidate keys for prefix queries.
+
+        The trie is C++-backed and far more compact than the dict; it
+        could also be persisted and mmap'd to share across workers.
+        """
+        key = (id(knowledge_base), len(knowledge_base))
+        trie = self._trie_cache.get(key)
+
+        if trie is None:
+            trie = marisa_trie.Trie(list(self._kb_choices(knowledge_base)))
+            self._trie_cache[key] = trie
+
+        return trie
+
+    def _prefix_match(
+        self,
+        text: str,
+        knowledge_base: dict
+    ) -> Optional[LinkingResult]:
+        """Match an abbreviation as a prefix of a known term.
+
+        Args:
+            text: Normalized candidate text (e.g. "amox")
+            knowledge_base: Knowledge base dictionary
+
+        Returns:
+            LinkingResult with match_type "partial", or None
+        """
+        if len(text) < 4:
+            # Too short to be a meaningful abbreviation
+            return None
+
+        choices = self._kb_choices(knowledge_base)
+        if MARISA_AVAILABLE:
+            candidates = self._kb_trie(knowledge_base).keys(text)
+        else:
+            candidates = [k for k in choices if k.startswith(text)]
+
+        if not candidates:
+            return None
+
+        # Shortest completion is the most specific expansion
+        kb_data = choices[min(candidates, key=len)]
+        return LinkingResult(
+            original=text,
+            canonical=kb_data["canonical"],
+            category=kb_data["category"],
+            confidence=0.85,
+            found=True,
+            match_type="partial"
+        )
+
+    def _normalize_text(self, text: str) -> str:
+        """Normalize entity text for knowledge-base lookup."""
+        return _normalize(text)
+
+    def link_entity(self, entity_text: str, entity_type: str) -> LinkingResult:
+        """
+        Link an entity to the matching knowledge base by type.
+
+        Results are memoized on (normalized text, type), so repeated
+        tokens cost one dict lookup instead of a fuzzy search.
+
+        Args:
+            entity_text: Entity text to link
+            entity_type: Entity type (e.g. "MEDICATION", "CONDITION")
+
+        Returns:
+            LinkingResult with linking information
+        """
+        return self._link_cached(
+            self._normalize_text(entity_text),
+            entity_type.upper()
+        )
+
+    def _link_uncached(self, norm_text: str, entity_type: str) -> LinkingResult:
+        """Dispatch a normalized lookup to the right knowledge base."""
+        if entity_type == "MEDICATION":
+            return self.link_medication(norm_text)
+        if entity_type == "CONDITION":
+            return self.link_condition(norm_text)
+
+        # Types without a knowledge base (DOSAGE, PRICE, ...) pass through
+        return LinkingResult(
+            original=norm_text,
+            canonical=norm_text,
+            category=entity_type,
+            confidence=0.0,
+            found=False,
+            match_type="none"
+        )
+
+    def clear_link_cache(self) -> None:
+        """Clear the memoized link results."""
+        self._link_cached.cache_clear()
+
     def link_medication(self, medication_text: str) -> LinkingResult:
         """
         Link medication to knowledge base.
@@ -105,7 +325,7 @@ class MedicalEntityLinker:
             >>> result.canonical
             'Amoxicillin'
         """
-        medication_lower = medication_text.lower().strip()
+        medication_lower = self._normalize_text(medication_text)
 
         # Try exact match
         if medication_lower in self.medications_kb:
@@ -131,6 +351,11 @@ class MedicalEntityLinker:
                     match_type="alias"
                 )
 
+        # Try abbreviation/prefix match
+        prefix_result = self._prefix_match(medication_lower, self.medications_kb)
+        if prefix_result:
+            return prefix_result
+
         # Try fuzzy match
         fuzzy_result = self._fuzzy_match(medication_lower, self.medications_kb)
         if fuzzy_result:
@@ -156,7 +381,7 @@ class MedicalEntityLinker:
         Returns:
             LinkingResult with linking information
         """
-        condition_lower = condition_text.lower().strip()
+        condition_lower = self._normalize_text(condition_text)
 
         # Try exact match
         if condition_lower in self.conditions_kb:
@@ -170,6 +395,11 @@ class MedicalEntityLinker:
                 match_type="exact"
             )
 
+        # Try abbreviation/prefix match
+        prefix_result = self._prefix_match(condition_lower, self.conditions_kb)
+        if prefix_result:
+            return prefix_result
+
         # Try fuzzy match
         fuzzy_result = self._fuzzy_match(condition_lower, self.conditions_kb)
         if fuzzy_result:
@@ -202,6 +432,45 @@ class MedicalEntityLinker:
         Returns:
             LinkingResult or None if no match
         """
+        if RAPIDFUZZ_AVAILABLE:
+            choices = self._kb_choices(knowledge_base)
+            match = _rf_process.extractOne(
+                text,
+                choices.keys(),
+                scorer=_rf_fuzz.ratio,
+                score_cutoff=threshold * 100,
+            )
+            if match:
+                matched_key, score, _ = match
+                kb_data = choices[matched_key]
+                return LinkingResult(
+                    original=text,
+                    canonical=kb_data["canonical"],
+                    category=kb_data["category"],
+                    confidence=score / 100,
+                    found=True,
+                    match_type="fuzzy"
+                )
+            return None
+
+        if NUMBA_AVAILABLE:
+            choices = self._kb_choices(knowledge_base)
+            keys, flat, offsets = self._kb_flat(knowledge_base)
+            query = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+            scores = _best_match_scores(query, flat, offsets)
+            best = int(np.argmax(scores)) if len(scores) else -1
+            if best >= 0 and scores[best] > threshold:
+                kb_data = choices[keys[best]]
+                return LinkingResult(
+                    original=text,
+                    canonical=kb_data["canonical"],
+                    category=kb_data["category"],
+                    confidence=float(scores[best]),
+                    found=True,
+                    match_type="fuzzy"
+                )
+            return None
+
         best_match = None
         best_score = threshold
 
@@ -246,6 +515,7 @@ class MedicalEntityLinker:
             "category": category,
             "aliases": [a.lower() for a in (aliases or [])],
         }
+        self.clear_link_cache()
         logger.debug(f"Added medication: {name} -> {canonical}")
 
     def add_condition(
@@ -259,4 +529,5 @@ class MedicalEntityLinker:
             "canonical": canonical,
             "category": category,
         }
+        self.clear_link_cache()
         logger.debug(f"Added condition: {name} -> {canonical}")
\ No newline at end of file
@@ -5,22 +5,36 @@ BRANCH-3: NLP Pipeline
 Author: Boris (Claude Code)
 """
 
+import os
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
 
+import numpy as np
 import spacy
 from spacy.tokens import Doc
 
 from src.core.exceptions import ModelLoadingError, EntityExtractionError
 from src.core.logger import get_logger
+from src.nlp._dedup import sweep as _dedup_sweep
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MedicalEntity:
-    """Medical entity extracted from text."""
+    """Medical entity extracted from text.
+
+    Slotted and immutable: the NER emits thousands of these per batch,
+    and dropping the per-instance __dict__ roughly halves their size.
+    """
 
     text: str
     entity_type: str  # MEDICATION, DOSAGE, CONDITION, SYMPTOM, PRICE, etc.
@@ -41,6 +55,70 @@ class MedicalEntity:
         }
 
 
+@dataclass
+class EntitySoA:
+    """Struct-of-arrays view of entities extracted from a text batch.
+
+    Parallel arrays replace one object per entity, so large batches
+    cost a handful of allocations and filtering can be vectorized,
+    e.g. ``soa.confidences > 0.8``. ``offsets[i]:offsets[i + 1]``
+    delimits the entities of input text i.
+    """
+
+    texts: np.ndarray        # object
+    types: np.ndarray        # U16
+    starts: np.ndarray       # int32
+    ends: np.ndarray         # int32
+    confidences: np.ndarray  # float32
+    normalized: np.ndarray   # object
+    offsets: np.ndarray      # int64, len == number of input texts + 1
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @classmethod
+    def from_entity_lists(cls, entity_lists: List[List["MedicalEntity"]]) -> "EntitySoA":
+        """Pack per-text entity lists into preallocated parallel arrays."""
+        offsets = np.zeros(len(entity_lists) + 1, dtype=np.int64)
+        for i, entities in enumerate(entity_lists):
+            offsets[i + 1] = offsets[i] + len(entities)
+        total = int(offsets[-1])
+
+        texts = np.empty(total, dtype=object)
+        types = np.empty(total, dtype="U16")
+        starts = np.empty(total, dtype=np.int32)
+        ends = np.empty(total, dtype=np.int32)
+        confidences = np.empty(total, dtype=np.float32)
+        normalized = np.empty(total, dtype=object)
+
+        i = 0
+        for entities in entity_lists:
+            for entity in entities:
+                texts[i] = entity.text
+                types[i] = entity.entity_type
+                starts[i] = entity.start_char
+                ends[i] = entity.end_char
+                confidences[i] = entity.confidence
+                normalized[i] = entity.normalized
+                i += 1
+
+        return cls(texts, types, starts, ends, confidences, normalized, offsets)
+
+    def to_dicts(self) -> List[dict]:
+        """Materialize per-entity dicts at the serialization boundary."""
+        return [
+            {
+                "text": self.texts[i],
+                "type": str(self.types[i]),
+                "start": int(self.starts[i]),
+                "end": int(self.ends[i]),
+                "confidence": float(self.confidences[i]),
+                "normalized": self.normalized[i],
+            }
+            for i in range(len(self.texts))
+        ]
+
+
 class MedicalNER:
     """Medical Named Entity Recognizer using spaCy."""
 
@@ -49,18 +127,46 @@ class MedicalNER:
     PRICE_PATTERN = r"(\d+\.?\d*)\s*(ETB|birr|USD|dollar|cent|EUR)"
     FREQUENCY_PATTERN = r"(once|twice|thrice|daily|every|per|times?)\s*(\d+)?(?:\s*(day|hour|week|month|year))?"
 
-    def __init__(self, model_name: str = "en_core_sci_md"):
+    # Compiled once at class creation; instances alias these, so creating
+    # many NER objects never recompiles the patterns
+    _DOSAGE_RE = re.compile(DOSAGE_PATTERN, re.IGNORECASE)
+    _PRICE_RE = re.compile(PRICE_PATTERN, re.IGNORECASE)
+    _FREQUENCY_RE = re.compile(FREQUENCY_PATTERN, re.IGNORECASE)
+
+    # All rule patterns in one alternation so rule-based extraction is a
+    # single pass over the text instead of one scan per pattern
+    _COMBINED_RE = re.compile(
+        f"(?P<DOSAGE>{DOSAGE_PATTERN})"
+        f"|(?P<PRICE>{PRICE_PATTERN})"
+        f"|(?P<FREQUENCY>{FREQUENCY_PATTERN})",
+        re.IGNORECASE,
+    )
+    _PATTERN_CONFIDENCE = {"DOSAGE": 0.90, "PRICE": 0.88, "FREQUENCY": 0.82}
+
+    # Only doc.ents is consumed downstream, so the tagger/parser stack
+    # is dead weight in this pipeline
+    EXCLUDED_PIPES = ["tagger", "parser", "lemmatizer", "attribute_ruler"]
+
+    def __init__(
+        self,
+        model_name: str = "en_core_sci_md",
+        exclude: Optional[List[str]] = None
+    ):
         """
         Initialize Medical NER.
 
         Args:
             model_name: spaCy model name
+            exclude: Pipeline components to skip loading; defaults to
+                everything except NER
 
         Raises:
             ModelLoadingError: If model cannot be loaded
         """
+        if exclude is None:
+            exclude = self.EXCLUDED_PIPES
         try:
-            self.nlp = spacy.load(model_name)
+            self.nlp = spacy.load(model_name, exclude=exclude)
             logger.info(f"Loaded medical NER model: {model_name}")
         except OSError as e:
             raise ModelLoadingError(
@@ -72,10 +178,89 @@ class MedicalNER:
         self._init_patterns()
 
     def _init_patterns(self) -> None:
-        """Initialize regex patterns for entity extraction."""
-        self.dosage_regex = re.compile(self.DOSAGE_PATTERN, re.IGNORECASE)
-        self.price_regex = re.compile(self.PRICE_PATTERN, re.IGNORECASE)
-        self.frequency_regex = re.compile(self.FREQUENCY_PATTERN, re.IGNORECASE)
+        """Bind the precompiled regex patterns for entity extraction."""
+        self.dosage_regex = self._DOSAGE_RE
+        self.price_regex = self._PRICE_RE
+        self.frequency_regex = self._FREQUENCY_RE
+        self._init_dictionary()
+
+    def _init_dictionary(self) -> None:
+        """Build the dictionary matcher over the knowledge-base terms.
+
+        With pyahocorasick all terms are matched in one linear sweep;
+        otherwise a single alternation regex keeps it to one pass.
+        """
+        from src.nlp.entity_linker import MedicalEntityLinker
+
+        terms = {}
+        for key, data in MedicalEntityLinker.MEDICATIONS_KB.items():
+            terms[key] = ("MEDICATION", data["canonical"])
+            for alias in data.get("aliases", []):
+                terms.setdefault(alias, ("MEDICATION", data["canonical"]))
+        for key, data in MedicalEntityLinker.CONDITIONS_KB.items():
+            terms.setdefault(key, ("CONDITION", data["canonical"]))
+
+        self._dictionary_terms = terms
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for term, meta in terms.items():
+                automaton.add_word(term, (term, meta))
+            automaton.make_automaton()
+            self._dictionary_automaton = automaton
+            self._dictionary_regex = None
+        else:
+            self._dictionary_automaton = None
+            alternation = "|".join(
+                re.escape(term)
+                for term in sorted(terms, key=len, reverse=True)
+            )
+            self._dictionary_regex = re.compile(
+                rf"\b(?:{alternation})\b", re.IGNORECASE
+            )
+
+    def _extract_dictionary_entities(self, text: str) -> List[MedicalEntity]:
+        """Extract medication/condition mentions with the dictionary matcher."""
+        entities = []
+        lowered = text.lower()
+
+        if self._dictionary_automaton is not None:
+            length = len(lowered)
+            for end_idx, (term, (entity_type, canonical)) in \
+                    self._dictionary_automaton.iter_long(lowered):
+                start = end_idx - len(term) + 1
+                end = end_idx + 1
+                # Enforce word boundaries the automaton doesn't know about
+                if start > 0 and lowered[start - 1].isalnum():
+                    continue
+                if end < length and lowered[end].isalnum():
+                    continue
+                entities.append(
+                    MedicalEntity(
+                        text=text[start:end],
+                        entity_type=entity_type,
+                        start_char=start,
+                        end_char=end,
+                        confidence=0.90,
+                        normalized=canonical,
+                    )
+                )
+        else:
+            for match in self._dictionary_regex.finditer(text):
+                entity_type, canonical = self._dictionary_terms[
+                    match.group(0).lower()
+                ]
+                entities.append(
+                    MedicalEntity(
+                        text=match.group(0),
+                        entity_type=entity_type,
+                        start_char=match.start(),
+                        end_char=match.end(),
+                        confidence=0.90,
+                        normalized=canonical,
+                    )
+                )
+
+        return entities
 
     def extract_entities(self, text: str) -> List[MedicalEntity]:
         """
@@ -99,10 +284,11 @@ class MedicalNER:
         try:
             entities = []
 
-            # spaCy NER
-            doc = self.nlp(text)
-            spacy_entities = self._extract_spacy_entities(doc)
-            entities.extend(spacy_entities)
+            # Model-backed NER (spaCy here; ONNX in OnnxMedicalNER)
+            entities.extend(self._extract_model_entities(text))
+
+            # Dictionary matching (one sweep over all known terms)
+            entities.extend(self._extract_dictionary_entities(text))
 
             # Rule-based extraction
             rule_entities = self._extract_rule_based_entities(text)
@@ -120,6 +306,121 @@ class MedicalNER:
                 details={"text_length": len(text)}
             )
 
+    def extract_entities_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32
+    ) -> List[List[MedicalEntity]]:
+        """
+        Extract medical entities from many texts as one fused batch.
+
+        nlp.pipe streams the texts through spaCy in batches, amortizing
+        tokenizer and pipeline overhead that extract_entities pays per
+        call.
+
+        Args:
+            texts: Input texts
+            batch_size: spaCy pipe batch size
+
+        Returns:
+            One list of MedicalEntity objects per input text
+
+        Raises:
+            EntityExtractionError: If extraction fails
+        """
+        try:
+            results = []
+            model_entities = self._extract_model_entities_batch(
+                texts, batch_size=batch_size
+            )
+
+            for text, entities in zip(texts, model_entities):
+                entities.extend(self._extract_dictionary_entities(text))
+                entities.extend(self._extract_rule_based_entities(text))
+                results.append(self._deduplicate_entities(entities))
+
+            logger.debug(f"Extracted entities from batch of {len(texts)} texts")
+            return results
+
+        except Exception as e:
+            raise EntityExtractionError(
+                f"Failed to extract entities in batch: {str(e)}",
+                details={"batch_size": len(texts)}
+            )
+
+    def extract_entities_stream(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 128
+    ) -> Iterator[MedicalEntity]:
+        """
+        Stream entities from an iterable of texts, one chunk at a time.
+
+        Unlike extract_entities_batch this never materializes all Docs
+        or result lists at once, so arbitrarily long inputs can be fed
+        as sentence-sized chunks with a bounded working set.
+
+        Args:
+            texts: Iterable of text chunks
+            batch_size: Model batch size and chunk materialization bound
+
+        Yields:
+            MedicalEntity objects in input order
+        """
+        # Going through the model hook keeps this backend-agnostic:
+        # subclasses that swap the forward pass inherit streaming too
+        iterator = iter(texts)
+        while chunk := list(islice(iterator, batch_size)):
+            model_entities = self._extract_model_entities_batch(
+                chunk, batch_size=batch_size
+            )
+            for text, entities in zip(chunk, model_entities):
+                entities.extend(self._extract_dictionary_entities(text))
+                entities.extend(self._extract_rule_based_entities(text))
+                yield from self._deduplicate_entities(entities)
+
+    def extract_entities_batch_soa(
+        self,
+        texts: List[str],
+        batch_size: int = 32
+    ) -> EntitySoA:
+        """
+        Extract entities from a batch into a struct-of-arrays container.
+
+        Same extraction as extract_entities_batch, but the results land
+        in parallel numpy arrays instead of one object per entity —
+        far fewer allocations on large batches, and downstream filters
+        can run vectorized.
+
+        Args:
+            texts: Input texts
+            batch_size: spaCy pipe batch size
+
+        Returns:
+            EntitySoA over all extracted entities
+
+        Raises:
+            EntityExtractionError: If extraction fails
+        """
+        return EntitySoA.from_entity_lists(
+            self.extract_entities_batch(texts, batch_size=batch_size)
+        )
+
+    def _extract_model_entities(self, text: str) -> List[MedicalEntity]:
+        """Run the model backend over one text."""
+        return self._extract_spacy_entities(self.nlp(text))
+
+    def _extract_model_entities_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32
+    ) -> List[List[MedicalEntity]]:
+        """Run the model backend over many texts as one batch."""
+        return [
+            self._extract_spacy_entities(doc)
+            for doc in self.nlp.pipe(texts, batch_size=batch_size)
+        ]
+
     def _extract_spacy_entities(self, doc: Doc) -> List[MedicalEntity]:
         """Extract entities using spaCy."""
         entities = []
@@ -141,47 +442,32 @@ class MedicalNER:
 
         return entities
 
-    def _extract_rule_based_entities(self, text: str) -> List[MedicalEntity]:
-        """Extract entities using regex patterns."""
-        entities = []
-
-        # Dosage extraction
-        for match in self.dosage_regex.finditer(text):
-            entities.append(
-                MedicalEntity(
-                    text=match.group(0),
-                    entity_type="DOSAGE",
-                    start_char=match.start(),
-                    end_char=match.end(),
-                    confidence=0.90,
-                )
-            )
+    def extract_patterns(self, text: str) -> Iterator[tuple]:
+        """Yield (kind, match) pairs from one combined-pattern pass.
 
-        # Price extraction
-        for match in self.price_regex.finditer(text):
-            entities.append(
-                MedicalEntity(
-                    text=match.group(0),
-                    entity_type="PRICE",
-                    start_char=match.start(),
-                    end_char=match.end(),
-                    confidence=0.88,
-                )
+        The alternation is tried dosage-first, so a span like "500mg"
+        demultiplexes to DOSAGE even though digits also open the price
+        pattern.
+        """
+        for match in self._COMBINED_RE.finditer(text):
+            kind = next(
+                name for name, value in match.groupdict().items()
+                if value is not None
             )
+            yield kind, match
 
-        # Frequency extraction
-        for match in self.frequency_regex.finditer(text):
-            entities.append(
-                MedicalEntity(
-                    text=match.group(0),
-                    entity_type="FREQUENCY",
-                    start_char=match.start(),
-                    end_char=match.end(),
-                    confidence=0.82,
-                )
+    def _extract_rule_based_entities(self, text: str) -> List[MedicalEntity]:
+        """Extract entities using the combined regex patterns."""
+        return [
+            MedicalEntity(
+                text=match.group(0),
+                entity_type=kind,
+                start_char=match.start(),
+                end_char=match.end(),
+                confidence=self._PATTERN_CONFIDENCE[kind],
             )
-
-        return entities
+            for kind, match in self.extract_patterns(text)
+        ]
 
     def _map_entity_type(self, spacy_label: str) -> Optional[str]:
         """Map spaCy entity labels to medical entity types."""
@@ -196,30 +482,40 @@ class MedicalNER:
         return mapping.get(spacy_label, "ENTITY")
 
     def _deduplicate_entities(self, entities: List[MedicalEntity]) -> List[MedicalEntity]:
-        """Remove overlapping entities, keeping highest confidence."""
+        """Remove overlapping entities, keeping highest confidence.
+
+        Sort by (start, -confidence) then sweep once tracking the
+        furthest kept end — O(n log n) instead of the pairwise O(n^2)
+        overlap scan. The result is ordered by start position.
+        """
         if not entities:
             return []
 
-        # Sort by start position, then by confidence (descending)
-        sorted_entities = sorted(
-            entities,
-            key=lambda e: (e.start_char, -e.confidence)
+        # Sort before dropping exact duplicates: first-seen per key is
+        # then the highest-confidence copy, honoring the keep-highest
+        # contract even when duplicate spans carry different scores
+        ordered = sorted(entities, key=lambda e: (e.start_char, -e.confidence))
+
+        seen = set()
+        unique = []
+        for entity in ordered:
+            key = (entity.start_char, entity.end_char,
+                   entity.entity_type, entity.text)
+            if key not in seen:
+                seen.add(key)
+                unique.append(entity)
+
+        # Starts are nondecreasing, so an entity overlaps a kept one
+        # exactly when it begins before the furthest kept end; the sweep
+        # itself runs as a compiled kernel over SoA arrays
+        n = len(unique)
+        starts = np.fromiter(
+            (e.start_char for e in unique), dtype=np.int64, count=n
         )
-
-        deduped = []
-        for entity in sorted_entities:
-            # Check if overlaps with existing entity
-            overlaps = False
-            for existing in deduped:
-                if (entity.start_char >= existing.start_char and
-                    entity.start_char < existing.end_char):
-                    overlaps = True
-                    break
-            
-            if not overlaps:
-                deduped.append(entity)
-
-        return sorted(deduped, key=lambda e: e.start_char)
+        ends = np.fromiter(
+            (e.end_char for e in unique), dtype=np.int64, count=n
+        )
+        return [unique[i] for i in _dedup_sweep(starts, ends)]
 
     def get_entities_by_type(
         self,
@@ -238,28 +534,71 @@ class MedicalNER:
         """
         return [e for e in entities if e.entity_type == entity_type]
 
-    def extract_medications(self, text: str) -> List[MedicalEntity]:
+    def extract_entities_from_doc(self, doc: Doc) -> List[MedicalEntity]:
+        """
+        Extract entities from an already-parsed Doc.
+
+        Skips the spaCy forward pass, so callers holding a Doc (shared
+        test fixtures, multi-query flows) pay for parsing once.
+
+        Args:
+            doc: Pre-parsed spaCy Doc
+
+        Returns:
+            List of extracted entities
+        """
+        entities = self._extract_spacy_entities(doc)
+        entities.extend(self._extract_dictionary_entities(doc.text))
+        entities.extend(self._extract_rule_based_entities(doc.text))
+        return self._deduplicate_entities(entities)
+
+    def extract_medications(self, text) -> List[MedicalEntity]:
         """
         Extract medication entities.
 
         Args:
-            text: Input text
+            text: Input text, or a pre-parsed Doc to skip re-parsing
 
         Returns:
             List of medication entities
         """
-        entities = self.extract_entities(text)
+        if isinstance(text, Doc):
+            entities = self.extract_entities_from_doc(text)
+        else:
+            entities = self.extract_entities(text)
         return self.get_entities_by_type(entities, "MEDICATION")
 
-    def extract_conditions(self, text: str) -> List[MedicalEntity]:
+    def extract_conditions(self, text) -> List[MedicalEntity]:
         """
         Extract condition entities.
 
         Args:
-            text: Input text
+            text: Input text, or a pre-parsed Doc to skip re-parsing
 
         Returns:
             List of condition entities
         """
-        entities = self.extract_entities(text)
-        return self.get_entities_by_type(entities, "CONDITION")
\ No newline at end of file
+        if isinstance(text, Doc):
+            entities = self.extract_entities_from_doc(text)
+        else:
+            entities = self.extract_entities(text)
+        return self.get_entities_by_type(entities, "CONDITION")
+
+
+def create_medical_ner(model_name: str = "en_core_sci_md") -> MedicalNER:
+    """
+    Create the NER backend selected by the NLP_BACKEND env var.
+
+    NLP_BACKEND=onnx-int8 picks the quantized ONNX backend (see
+    scripts/export_ner_onnx.py); anything else loads the spaCy model.
+
+    Args:
+        model_name: spaCy model name for the default backend
+
+    Returns:
+        MedicalNER (or subclass) instance
+    """
+    if os.environ.get("NLP_BACKEND") == "onnx-int8":
+        from src.nlp.onnx_ner import OnnxMedicalNER
+        return OnnxMedicalNER()
+    return MedicalNER(model_name=model_name)
\ No newline at end of file
@@ -5,20 +5,25 @@ BRANCH-3: NLP Pipeline
 Author: Boris (Claude Code)
 """
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import List, Optional
 
 from src.core.logger import get_logger
-from src.nlp.medical_ner import MedicalNER, MedicalEntity
+from src.nlp.medical_ner import MedicalNER, MedicalEntity, create_medical_ner
 from src.nlp.text_classifier import MedicalTextClassifier, ClassificationResult
 from src.nlp.entity_linker import MedicalEntityLinker, LinkingResult
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedMessage:
-    """Result of processing a medical message."""
+    """Result of processing a medical message.
+
+    Slotted so the dataclass fields are the schema: an attribute
+    outside the declared set raises instead of landing in a __dict__.
+    """
 
     text: str
     is_medical: bool
@@ -62,6 +67,10 @@ class ProcessedMessage:
 class MedicalMessageProcessor:
     """Process medical messages through NLP pipeline."""
 
+    # Best-known batch size from the pipeline throughput sweep; the
+    # benchmark in tests/performance pins the default near the optimum
+    DEFAULT_BATCH_SIZE = 32
+
     def __init__(
         self,
         use_gpu: bool = True,
@@ -76,7 +85,7 @@ class MedicalMessageProcessor:
             nlp_model: spaCy model name
             classifier_model: Text classifier model name
         """
-        self.ner = MedicalNER(model_name=nlp_model)
+        self.ner = create_medical_ner(model_name=nlp_model)
         self.classifier = MedicalTextClassifier(model_path=classifier_model)
         self.entity_linker = MedicalEntityLinker()
 
@@ -203,6 +212,81 @@ class MedicalMessageProcessor:
         total_score = sum(scores)
         return min(total_score, 1.0)
 
+    def process_batch(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None
+    ) -> List[ProcessedMessage]:
+        """
+        Process multiple messages with fused NER and classification.
+
+        Classification runs as one batched transformer call and NER
+        streams through spaCy's nlp.pipe, so model overhead is paid per
+        batch instead of per message. Falls back to the per-message
+        path if either batch stage fails, preserving its per-message
+        error reporting.
+
+        Args:
+            texts: List of message texts
+            batch_size: Model batch size; defaults to DEFAULT_BATCH_SIZE
+
+        Returns:
+            List of ProcessedMessage objects
+        """
+        if batch_size is None:
+            batch_size = self.DEFAULT_BATCH_SIZE
+        try:
+            classifications = self.classifier.batch_classify(
+                texts, batch_size=batch_size
+            )
+            entity_lists = self.ner.extract_entities_batch(
+                texts, batch_size=batch_size
+            )
+        except Exception as e:
+            logger.warning(f"Batch processing failed, falling back: {e}")
+            return [self.process_message(text) for text in texts]
+
+        results = []
+        for text, classification, entities in zip(
+            texts, classifications, entity_lists
+        ):
+            linked_entities = self._link_entities(entities) if entities else []
+            quality_score = self._calculate_quality_score(
+                classification,
+                entities,
+                linked_entities,
+                text
+            )
+            results.append(
+                ProcessedMessage(
+                    text=text,
+                    is_medical=classification.is_medical(),
+                    medical_confidence=classification.confidence,
+                    entities=entities,
+                    linked_entities=linked_entities,
+                    quality_score=quality_score,
+                    processing_status="success"
+                )
+            )
+
+        return results
+
+    async def process_message_async(self, text: str) -> ProcessedMessage:
+        """
+        Process one message off the event loop.
+
+        Defers the CPU-bound pipeline to a worker thread so async
+        callers can gather many messages; spaCy's tokenizer releases
+        the GIL in its Cython layers, so gathers overlap in practice.
+
+        Args:
+            text: Input message text
+
+        Returns:
+            ProcessedMessage with all results
+        """
+        return await asyncio.to_thread(self.process_message, text)
+
     def batch_process(self, texts: List[str]) -> List[ProcessedMessage]:
         """
         Process multiple messages.
@@ -213,7 +297,7 @@ class MedicalMessageProcessor:
         Returns:
             List of ProcessedMessage objects
         """
-        return [self.process_message(text) for text in texts]
+        return self.process_batch(texts)
 
     def process_messages_generator(self, texts: List[str]):
         """
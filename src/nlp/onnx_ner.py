@@ -0,0 +1,99 @@
+"""
+int8-quantized ONNX backend for medical NER.
+
+BRANCH-3: NLP Pipeline
+"""
+
+from pathlib import Path
+from typing import List
+
+from src.core.exceptions import ModelLoadingError
+from src.core.logger import get_logger
+from src.nlp.medical_ner import MedicalNER, MedicalEntity
+
+try:
+    from optimum.onnxruntime import ORTModelForTokenClassification
+    from transformers import AutoTokenizer, pipeline
+    OPTIMUM_AVAILABLE = True
+except ImportError:
+    OPTIMUM_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+BASE_DIR = Path(__file__).parent.parent.parent
+DEFAULT_ONNX_MODEL = str(BASE_DIR / "models" / "nlp_models" / "ner_onnx_int8")
+
+
+class OnnxMedicalNER(MedicalNER):
+    """Medical NER backed by an int8 ONNX token classifier.
+
+    The model directory is produced by scripts/export_ner_onnx.py.
+    Only the model forward pass differs from MedicalNER; the rule-based
+    and dictionary extractors plus dedup are inherited.
+    """
+
+    def __init__(self, model_path: str = DEFAULT_ONNX_MODEL):
+        """
+        Initialize the ONNX NER backend.
+
+        Args:
+            model_path: Directory with the quantized ONNX model
+
+        Raises:
+            ModelLoadingError: If the model cannot be loaded
+        """
+        if not OPTIMUM_AVAILABLE:
+            raise ModelLoadingError(
+                "optimum[onnxruntime] is required for the onnx-int8 backend",
+                details={"model_path": model_path}
+            )
+
+        try:
+            model = ORTModelForTokenClassification.from_pretrained(model_path)
+            tokenizer = AutoTokenizer.from_pretrained(model_path)
+            self._pipeline = pipeline(
+                "token-classification",
+                model=model,
+                tokenizer=tokenizer,
+                aggregation_strategy="simple",
+            )
+            logger.info(f"Loaded int8 ONNX NER model from: {model_path}")
+        except Exception as e:
+            raise ModelLoadingError(
+                f"Failed to load ONNX NER model from: {model_path}",
+                details={"error": str(e)}
+            )
+
+        self._init_patterns()
+
+    def _extract_model_entities(self, text: str) -> List[MedicalEntity]:
+        """Run the quantized model over one text."""
+        return self._from_pipeline_output(self._pipeline(text))
+
+    def _extract_model_entities_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32
+    ) -> List[List[MedicalEntity]]:
+        """Run the quantized model over many texts as one batch."""
+        outputs = self._pipeline(list(texts), batch_size=batch_size)
+        return [self._from_pipeline_output(spans) for spans in outputs]
+
+    def _from_pipeline_output(self, spans: list) -> List[MedicalEntity]:
+        """Convert aggregated token-classification spans to entities."""
+        entities = []
+
+        for span in spans:
+            entity_type = self._map_entity_type(span["entity_group"])
+            if entity_type:
+                entities.append(
+                    MedicalEntity(
+                        text=span["word"],
+                        entity_type=entity_type,
+                        start_char=int(span["start"]),
+                        end_char=int(span["end"]),
+                        confidence=float(span["score"]),
+                    )
+                )
+
+        return entities
@@ -1,8 +1,12 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
 from typing import Tuple, List
 
+import numpy as np
+
+import spacy
+from spacy.matcher import PhraseMatcher
 from transformers import pipeline
 from src.core.exceptions import ModelLoadingError, TextClassificationError
 from src.core.logger import get_logger
@@ -14,11 +18,32 @@ logger = get_logger(__name__)
 BASE_DIR = Path(__file__).parent.parent.parent
 DEFAULT_LOCAL_MODEL = str(BASE_DIR / "models" / "nlp_models" / "classifier")
 
-@dataclass
+# One translate table that lowercases ASCII and maps punctuation to
+# spaces — a single C-level pass instead of lower() + strip chains
+_NORMALIZE_TABLE = str.maketrans(
+    {c: " " for c in "!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"}
+    | {chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)}
+)
+
 class ClassificationResult:
-    label: str  # "medical" or "non-medical"
-    confidence: float
-    reasoning: str = ""
+    """Classification outcome with uint8-quantized confidence.
+
+    Confidence is stored as one byte (0-255) and decoded on access:
+    bulk classification keeps thousands of these alive, and a byte per
+    result beats a float64 for cache-resident aggregation. Quantization
+    error is at most 1/255, well under the decision thresholds used.
+    """
+
+    __slots__ = ("label", "_conf_q", "reasoning")
+
+    def __init__(self, label: str, confidence: float, reasoning: str = ""):
+        self.label = label  # "medical" or "non-medical"
+        self._conf_q = int(round(min(max(confidence, 0.0), 1.0) * 255))
+        self.reasoning = reasoning
+
+    @property
+    def confidence(self) -> float:
+        return self._conf_q / 255.0
 
     def is_medical(self) -> bool:
         return self.label.lower() == "medical"
@@ -31,15 +56,22 @@ class ClassificationResult:
         }
 
 class MedicalTextClassifier:
-    MEDICAL_KEYWORDS = {
-        "medication", "drug", "medicine", "treatment", "disease",
-        "symptom", "patient", "doctor", "hospital", "clinic",
-        "fever", "cough", "pain", "infection", "vaccine",
-        "tablet", "capsule", "injection", "dosage", "prescription",
-        "health", "medical", "pharma", "antibiotics", "malaria",
-        "malaria treatment", "artemether", "amoxicillin", "paracetamol"
+    KEYWORD_CATEGORIES = {
+        "medication": {
+            "medication", "drug", "medicine", "vaccine", "tablet",
+            "capsule", "injection", "dosage", "prescription",
+            "antibiotics", "artemether", "amoxicillin", "paracetamol",
+        },
+        "symptom": {"symptom", "fever", "cough", "pain"},
+        "condition": {"disease", "infection", "malaria", "malaria treatment"},
+        "general": {
+            "treatment", "patient", "doctor", "hospital", "clinic",
+            "health", "medical", "pharma",
+        },
     }
 
+    MEDICAL_KEYWORDS = set().union(*KEYWORD_CATEGORIES.values())
+
     def __init__(self, model_path: str = DEFAULT_LOCAL_MODEL):
         """
         Initialize classifier using local assets.
@@ -63,13 +95,41 @@ class MedicalTextClassifier:
                 local_files_only=local_only # 👈 CRITICAL: Prevents network calls
             )
             logger.info(f"Loaded text classifier from: {model_to_load}")
-            
+
         except Exception as e:
             raise ModelLoadingError(
                 f"Failed to load classifier model from: {model_path}",
                 details={"error": str(e)}
             )
 
+        self._build_keyword_matcher()
+        # Bound per instance so the cache dies with the classifier
+        # instead of pinning it at class level
+        self._classify_cached = lru_cache(maxsize=4096)(self._classify_uncached)
+
+    def _build_keyword_matcher(self) -> None:
+        """Build the PhraseMatcher for one-pass keyword matching.
+
+        A blank-English tokenizer feeds a PhraseMatcher keyed on LOWER,
+        so matching runs over hashed StringStore ids at Cython level
+        instead of Python substring compares, with proper token
+        boundaries for multi-word keywords.
+        """
+        if getattr(self, "_kw_nlp", None) is None:
+            self._kw_nlp = spacy.blank("en")
+        matcher = PhraseMatcher(self._kw_nlp.vocab, attr="LOWER")
+        for keyword in self.MEDICAL_KEYWORDS:
+            matcher.add(keyword, [self._kw_nlp.make_doc(keyword)])
+        self._kw_matcher = matcher
+
+    def _find_keywords(self, text_lower: str) -> set:
+        """Return the distinct keywords present in the lowered text."""
+        doc = self._kw_nlp.make_doc(text_lower)
+        strings = self._kw_nlp.vocab.strings
+        return {
+            strings[match_id] for match_id, _, _ in self._kw_matcher(doc)
+        }
+
     def classify(self, text: str) -> ClassificationResult:
         """
         Classify text as medical or non-medical.
@@ -96,6 +156,23 @@ class MedicalTextClassifier:
                 reasoning="Empty text"
             )
 
+        # Fast reject: substring containment is a superset of the
+        # tokenized matcher's hits, and with zero keyword matches the
+        # combined score can never clear the medical threshold — so
+        # texts without any medical vocabulary skip tokenization and
+        # model inference entirely (str.__contains__ is memchr-fast)
+        lowered = text.lower()
+        if not any(keyword in lowered for keyword in self.MEDICAL_KEYWORDS):
+            return ClassificationResult(
+                label="non-medical",
+                confidence=0.99,
+                reasoning="No medical vocabulary present"
+            )
+
+        return self._classify_cached(text)
+
+    def _classify_uncached(self, text: str) -> ClassificationResult:
+        """Run the model for one text; classify memoizes this per input."""
         try:
             # Truncate if too long (transformer limits)
             text = text[:512]
@@ -135,11 +212,7 @@ class MedicalTextClassifier:
         Returns:
             Score between 0 and 1
         """
-        text_lower = text.lower()
-        keyword_matches = sum(
-            1 for keyword in self.MEDICAL_KEYWORDS
-            if keyword in text_lower
-        )
+        keyword_matches = len(self._find_keywords(text.translate(_NORMALIZE_TABLE)))
 
         # Normalize score
         max_matches = len(self.MEDICAL_KEYWORDS)
@@ -147,6 +220,23 @@ class MedicalTextClassifier:
 
         return score
 
+    def classify_detailed(self, text: str) -> dict:
+        """
+        Count matched keywords per category in one pass.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Dict mapping each keyword category to its distinct-match
+            count, e.g. {"medication": 2, "symptom": 1, ...}
+        """
+        found = self._find_keywords(text.translate(_NORMALIZE_TABLE)) if text else set()
+        return {
+            category: len(found & keywords)
+            for category, keywords in self.KEYWORD_CATEGORIES.items()
+        }
+
     def _combine_scores(
         self,
         keyword_score: float,
@@ -209,24 +299,103 @@ class MedicalTextClassifier:
 
         return "; ".join(reasoning_parts) if reasoning_parts else "Default classification"
 
-    def batch_classify(self, texts: list[str]) -> list[ClassificationResult]:
+    def batch_classify(
+        self,
+        texts: list[str],
+        batch_size: int = 32
+    ) -> list[ClassificationResult]:
         """
-        Classify multiple texts.
+        Classify multiple texts in one batched transformer call.
+
+        The model sees all non-empty texts at once, so tokenization and
+        inference run as fused batches instead of one forward pass per
+        message.
 
         Args:
             texts: List of texts to classify
+            batch_size: Transformer pipeline batch size
 
         Returns:
             List of ClassificationResult objects
+
+        Raises:
+            TextClassificationError: If classification fails
+        """
+        results: list = [None] * len(texts)
+
+        pending = [
+            (i, text[:512]) for i, text in enumerate(texts)
+            if text and text.strip()
+        ]
+        for i in range(len(texts)):
+            if results[i] is None and not (texts[i] and texts[i].strip()):
+                results[i] = ClassificationResult(
+                    label="non-medical",
+                    confidence=1.0,
+                    reasoning="Empty text"
+                )
+
+        if pending:
+            try:
+                outputs = self.classifier(
+                    [text for _, text in pending], batch_size=batch_size
+                )
+                for (i, text), output in zip(pending, outputs):
+                    confidence, label, reasoning = self._combine_scores(
+                        self._keyword_based_score(text),
+                        output,
+                        text
+                    )
+                    results[i] = ClassificationResult(
+                        label=label,
+                        confidence=confidence,
+                        reasoning=reasoning
+                    )
+            except Exception as e:
+                raise TextClassificationError(
+                    f"Failed to classify batch: {str(e)}",
+                    details={"batch_size": len(texts)}
+                )
+
+        return results
+
+    def classify_batch_confidence(
+        self,
+        texts: list[str],
+        batch_size: int = 32
+    ) -> np.ndarray:
         """
-        return [self.classify(text) for text in texts]
+        Classify a batch and return confidences as a dense uint8 array.
+
+        Args:
+            texts: List of texts to classify
+            batch_size: Transformer pipeline batch size
+
+        Returns:
+            uint8 array of quantized confidences (value / 255 decodes)
+        """
+        results = self.batch_classify(texts, batch_size=batch_size)
+        return np.fromiter(
+            (r._conf_q for r in results), dtype=np.uint8, count=len(results)
+        )
+
+    def clear_classify_cache(self) -> None:
+        """Drop memoized classify results (after keyword changes)."""
+        self._classify_cached.cache_clear()
 
     def add_medical_keyword(self, keyword: str) -> None:
         """Add custom medical keyword."""
         self.MEDICAL_KEYWORDS.add(keyword.lower())
+        self.KEYWORD_CATEGORIES["general"].add(keyword.lower())
+        self._build_keyword_matcher()
+        self.clear_classify_cache()
         logger.debug(f"Added medical keyword: {keyword}")
 
     def remove_medical_keyword(self, keyword: str) -> None:
         """Remove medical keyword."""
         self.MEDICAL_KEYWORDS.discard(keyword.lower())
+        for keywords in self.KEYWORD_CATEGORIES.values():
+            keywords.discard(keyword.lower())
+        self._build_keyword_matcher()
+        self.clear_classify_cache()
         logger.debug(f"Removed medical keyword: {keyword}")
\ No newline at end of file
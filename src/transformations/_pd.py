@@ -0,0 +1,69 @@
+"""
+Optional distributed-pandas backend selection.
+
+BRANCH-5: Data Transformation
+Author: Boris (Claude Code)
+"""
+
+import pandas as pd
+
+from ..core.logger import get_logger
+
+try:
+    import modin.pandas as mpd
+    MODIN_AVAILABLE = True
+except ImportError:
+    mpd = None
+    MODIN_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# Frames at or above this size are worth partitioning across workers
+LARGE_FRAME_BYTES = 1 * 1024 * 1024 * 1024  # 1 GB
+
+
+def get_pd(df_or_size=None):
+    """
+    Get the dataframe namespace to use.
+
+    Args:
+        df_or_size: Dataframe or size in bytes; None selects by availability
+
+    Returns:
+        modin.pandas for large inputs when Modin is installed, else pandas
+    """
+    if not MODIN_AVAILABLE:
+        return pd
+
+    if df_or_size is None:
+        return mpd
+
+    if isinstance(df_or_size, (int, float)):
+        size = df_or_size
+    else:
+        size = df_or_size.memory_usage(deep=False).sum()
+
+    return mpd if size >= LARGE_FRAME_BYTES else pd
+
+
+def maybe_distribute(df):
+    """
+    Convert a large pandas dataframe to a Modin frame when available.
+
+    Small frames and environments without Modin pass through unchanged,
+    so callers keep the plain pandas API either way.
+
+    Args:
+        df: Input dataframe
+
+    Returns:
+        Input frame, possibly wrapped as a Modin dataframe
+    """
+    if not MODIN_AVAILABLE or not isinstance(df, pd.DataFrame):
+        return df
+
+    if df.memory_usage(deep=False).sum() >= LARGE_FRAME_BYTES:
+        logger.info("Large frame detected, distributing via Modin")
+        return mpd.DataFrame(df)
+
+    return df
@@ -0,0 +1,41 @@
+"""
+Compiled kernels for numeric quality checks.
+
+BRANCH-5: Data Transformation
+Author: Boris (Claude Code)
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # No fastmath here: its no-NaN assumption lets LLVM fold the
+    # isnan check to False, which would zero the null count
+    @njit(parallel=True, cache=True)
+    def range_and_null_count(col, min_v, max_v):
+        """Fused null + out-of-range count over a float column."""
+        n_null = 0
+        n_oor = 0
+        for i in prange(col.size):
+            value = col[i]
+            if np.isnan(value):
+                n_null += 1
+            elif value < min_v or value > max_v:
+                n_oor += 1
+        return n_null, n_oor
+
+else:
+
+    def range_and_null_count(col, min_v, max_v):
+        """NumPy fallback when numba is unavailable."""
+        n_null = int(np.isnan(col).sum())
+        with np.errstate(invalid="ignore"):
+            n_oor = int(((col < min_v) | (col > max_v)).sum())
+        return n_null, n_oor
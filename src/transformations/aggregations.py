@@ -5,18 +5,66 @@ BRANCH-5: Data Transformation
 Author: Boris (Claude Code)
 """
 
-from typing import Dict, List, Any, Optional
-from collections import Counter
+from typing import Dict, List, Any, Optional, Sequence, Union
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+import heapq
+import os
 import statistics
 
+import numpy as np
+
 from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Below this row count, process startup costs more than the reduce saves
+PARALLEL_MIN_ROWS = 50_000
+
+
+def _count_chunk(chunk: List[Dict], field: str) -> Counter:
+    """Count field values in one partition (worker-side map step)."""
+    return Counter(
+        item.get(field) for item in chunk if item.get(field) is not None
+    )
+
+
+def _sum_chunk(chunk: List[Dict], field: str, group_by: str) -> Dict:
+    """Sum field values per group in one partition (worker-side map step)."""
+    groups: Dict = defaultdict(float)
+    for item in chunk:
+        key = item.get(group_by)
+        if key is not None:
+            groups[key] += item.get(field, 0)
+    return dict(groups)
+
 
 class AggregationEngine:
     """Aggregate and summarize data."""
 
+    @staticmethod
+    def _map_partitions(fn, data: List[Dict], *args) -> List:
+        """
+        Run an associative map step over list partitions in parallel.
+
+        Args:
+            fn: Module-level function applied to each partition
+            data: Full list of data dictionaries
+            *args: Extra arguments broadcast to every partition
+
+        Returns:
+            List of per-partition results, ready to merge
+        """
+        workers = os.cpu_count() or 1
+        chunk_size = -(-len(data) // workers)
+        chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(fn, chunks, *([arg] * len(chunks) for arg in args))
+            )
+
     @staticmethod
     def count_by_field(data: List[Dict], field: str) -> Dict[str, int]:
         """
@@ -30,8 +78,15 @@ class AggregationEngine:
             Dictionary of {value: count}
         """
         logger.debug(f"Counting by field: {field}")
-        values = [item.get(field) for item in data if item.get(field) is not None]
-        counts = dict(Counter(values))
+
+        if len(data) >= PARALLEL_MIN_ROWS:
+            merged = Counter()
+            for partial in AggregationEngine._map_partitions(_count_chunk, data, field):
+                merged.update(partial)
+            counts = dict(merged)
+        else:
+            counts = dict(_count_chunk(data, field))
+
         logger.info(f"Found {len(counts)} unique values in {field}")
         return counts
 
@@ -55,12 +110,15 @@ class AggregationEngine:
         logger.debug(f"Summing {field}" + (f" grouped by {group_by}" if group_by else ""))
 
         if group_by:
-            groups = {}
-            for item in data:
-                key = item.get(group_by)
-                if key is not None:
-                    groups.setdefault(key, 0)
-                    groups[key] += item.get(field, 0)
+            if len(data) >= PARALLEL_MIN_ROWS:
+                merged = Counter()
+                for partial in AggregationEngine._map_partitions(
+                    _sum_chunk, data, field, group_by
+                ):
+                    merged.update(partial)
+                groups = dict(merged)
+            else:
+                groups = _sum_chunk(data, field, group_by)
             logger.info(f"Grouped sum by {group_by}: {len(groups)} groups")
             return groups
         else:
@@ -134,30 +192,31 @@ class AggregationEngine:
         return groups
 
     @staticmethod
-    def percentile(values: List[float], percentile: float) -> float:
+    def percentile(
+        values: Union[List[float], np.ndarray],
+        percentile: Union[float, Sequence[float]]
+    ) -> Union[float, np.ndarray]:
         """
         Calculate percentile value.
 
         Args:
-            values: List of numeric values
-            percentile: Percentile (0-100)
+            values: List or array of numeric values
+            percentile: Percentile (0-100), or a sequence of percentiles
+                to compute in a single pass
 
         Returns:
-            Percentile value
+            Percentile value, or array of values if percentile is a sequence
         """
-        if not values:
-            return 0
+        arr = np.asarray(values, dtype=np.float64)
 
-        sorted_values = sorted(values)
-        index = (percentile / 100) * (len(sorted_values) - 1)
-        lower = int(index)
-        upper = lower + 1
+        if arr.size == 0:
+            return 0
 
-        if upper >= len(sorted_values):
-            return sorted_values[lower]
+        quantile = np.quantile(arr, np.asarray(percentile) / 100.0, method="linear")
 
-        weight = index - lower
-        return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+        if quantile.ndim == 0:
+            return float(quantile)
+        return quantile
 
     @staticmethod
     def get_statistics(values: List[float]) -> Dict[str, float]:
@@ -173,21 +232,45 @@ class AggregationEngine:
         if not values:
             return {}
 
-        sorted_values = sorted(values)
-        n = len(sorted_values)
+        # One sort, then every statistic reads the sorted array directly
+        arr = np.sort(np.asarray(values, dtype=np.float64))
+        n = arr.size
+
+        q25, q75 = AggregationEngine._percentiles_of_sorted(arr, (25, 75))
 
         return {
             "count": n,
-            "sum": sum(sorted_values),
-            "mean": statistics.mean(sorted_values),
-            "median": statistics.median(sorted_values),
-            "stdev": statistics.stdev(sorted_values) if n > 1 else 0,
-            "min": min(sorted_values),
-            "max": max(sorted_values),
-            "q25": AggregationEngine.percentile(sorted_values, 25),
-            "q75": AggregationEngine.percentile(sorted_values, 75),
+            "sum": float(arr.sum()),
+            "mean": float(arr.mean()),
+            "median": float((arr[(n - 1) // 2] + arr[n // 2]) / 2),
+            "stdev": float(arr.std(ddof=1)) if n > 1 else 0,
+            "min": float(arr[0]),
+            "max": float(arr[-1]),
+            "q25": float(q25),
+            "q75": float(q75),
         }
 
+    @staticmethod
+    def _percentiles_of_sorted(
+        sorted_arr: np.ndarray,
+        percentiles: Sequence[float]
+    ) -> np.ndarray:
+        """
+        Interpolate percentiles from an already-sorted array.
+
+        Args:
+            sorted_arr: Values sorted ascending
+            percentiles: Percentiles (0-100)
+
+        Returns:
+            Array of percentile values
+        """
+        indices = np.asarray(percentiles, dtype=np.float64) / 100.0 * (sorted_arr.size - 1)
+        lower = indices.astype(np.intp)
+        upper = np.minimum(lower + 1, sorted_arr.size - 1)
+        weight = indices - lower
+        return sorted_arr[lower] * (1 - weight) + sorted_arr[upper] * weight
+
     @staticmethod
     def pivot_table(
         data: List[Dict],
@@ -211,27 +294,51 @@ class AggregationEngine:
         """
         logger.debug(f"Creating pivot table: {index_field} x {column_field}")
 
-        pivot = {}
+        # Accumulate (running_sum, count) per cell. For large inputs the
+        # outer dict is pre-built from the distinct index values so it
+        # never rehashes mid-accumulation; small inputs skip that pass.
+        if len(data) >= 1000:
+            rows = {
+                item[index_field]
+                for item in data
+                if item.get(index_field) is not None
+            }
+            cells = defaultdict(
+                lambda: defaultdict(lambda: [0.0, 0]),
+                {r: defaultdict(lambda: [0.0, 0]) for r in rows},
+            )
+        else:
+            cells = defaultdict(lambda: defaultdict(lambda: [0.0, 0]))
+
+        # Counting never touches the values, so non-numeric value
+        # columns stay valid for aggregation="count"
+        accumulate_sum = aggregation != "count"
 
         for item in data:
             row = item.get(index_field)
             col = item.get(column_field)
-            val = item.get(value_field, 0)
 
             if row is not None and col is not None:
-                if row not in pivot:
-                    pivot[row] = {}
-
-                if col not in pivot[row]:
-                    if aggregation == "count":
-                        pivot[row][col] = 0
-                    else:
-                        pivot[row][col] = val
-
-                if aggregation == "sum":
-                    pivot[row][col] += val
-                elif aggregation == "count":
-                    pivot[row][col] += 1
+                cell = cells[row][col]
+                if accumulate_sum:
+                    cell[0] += item.get(value_field, 0)
+                cell[1] += 1
+
+        if aggregation == "count":
+            pivot = {
+                row: {col: count for col, (_, count) in cols.items()}
+                for row, cols in cells.items() if cols
+            }
+        elif aggregation == "mean":
+            pivot = {
+                row: {col: total / count for col, (total, count) in cols.items()}
+                for row, cols in cells.items() if cols
+            }
+        else:
+            pivot = {
+                row: {col: total for col, (total, _) in cols.items()}
+                for row, cols in cells.items() if cols
+            }
 
         logger.info(f"Created pivot table: {len(pivot)} rows")
         return pivot
@@ -247,21 +354,19 @@ class AggregationEngine:
         Returns:
             List of flattened records
         """
-        records = []
+        records: List[Dict] = []
+        append = records.append
+        extend = records.extend
 
         for key, value in data.items():
             if isinstance(value, dict):
-                for subkey, subval in value.items():
-                    records.append({
-                        "key": key,
-                        "subkey": subkey,
-                        "value": subval,
-                    })
+                # C-level inner loop: one comprehension per nested dict
+                extend(
+                    {"key": key, "subkey": subkey, "value": subval}
+                    for subkey, subval in value.items()
+                )
             else:
-                records.append({
-                    "key": key,
-                    "value": value,
-                })
+                append({"key": key, "value": value})
 
         return records
 
@@ -282,8 +387,8 @@ class AggregationEngine:
         Returns:
             List of (key, value) tuples
         """
-        sorted_items = sorted(data.items(), key=lambda x: x[1], reverse=reverse)
-        return sorted_items[:n]
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(n, data.items(), key=itemgetter(1))
 
     @staticmethod
     def bottom_n(
@@ -10,10 +10,45 @@ import numpy as np
 from typing import Optional, List, Dict, Any
 
 from ..core.logger import get_logger
+from ._pd import maybe_distribute
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
 
 logger = get_logger(__name__)
 
 
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _compute_bounds_mask(mat, lowers, uppers):
+        """Fused per-row bounds check over a 2-D float block."""
+        n, k = mat.shape
+        out = np.empty(n, dtype=np.bool_)
+        for i in prange(n):
+            ok = True
+            for j in range(k):
+                value = mat[i, j]
+                ok = ok and (lowers[j] <= value <= uppers[j])
+            out[i] = ok
+        return out
+
+else:
+
+    def _compute_bounds_mask(mat, lowers, uppers):
+        """NumPy fallback when numba is unavailable."""
+        return ((mat >= lowers) & (mat <= uppers)).all(axis=1)
+
+
 class DataCleaner:
     """Clean, normalize, and transform data."""
 
@@ -35,9 +70,13 @@ class DataCleaner:
             Dataframe with duplicates removed
         """
         logger.debug(f"Removing duplicates (keep={keep})...")
+        df = maybe_distribute(df)
         initial_rows = len(df)
 
-        df_clean = df.drop_duplicates(subset=subset, keep=keep)
+        # Hash only the subset columns and slice once; the result shares
+        # memory with the input where pandas allows it
+        mask = ~df.duplicated(subset=subset, keep=keep)
+        df_clean = df.loc[mask]
         removed = initial_rows - len(df_clean)
 
         logger.info(f"Removed {removed} duplicate rows")
@@ -61,6 +100,7 @@ class DataCleaner:
             Cleaned dataframe
         """
         logger.debug(f"Handling nulls with strategy: {strategy}")
+        df = maybe_distribute(df)
         null_count = df.isnull().sum().sum()
 
         if null_count == 0:
@@ -103,24 +143,34 @@ class DataCleaner:
         """
         logger.debug(f"Normalizing {columns} using {method}...")
 
-        df_norm = df.copy()
-
+        valid_columns = [col for col in columns if col in df.columns]
         for col in columns:
             if col not in df.columns:
                 logger.warning(f"Column {col} not found")
-                continue
 
+        # Shallow copy: only the normalized columns are rewritten below,
+        # untouched columns keep sharing memory with the input frame
+        df_norm = df.copy(deep=False)
+
+        if valid_columns:
+            # One batched sweep over all columns instead of per-column passes
+            sub = df_norm[valid_columns].to_numpy(dtype=np.float64)
+
+            # nan-aware reductions keep the pandas skipna semantics:
+            # stats ignore NaN cells, which stay NaN in the output
             if method == "minmax":
-                min_val = df_norm[col].min()
-                max_val = df_norm[col].max()
-                df_norm[col] = (df_norm[col] - min_val) / (max_val - min_val)
+                min_vals = np.nanmin(sub, axis=0)
+                max_vals = np.nanmax(sub, axis=0)
+                ranges = np.where(max_vals == min_vals, 1.0, max_vals - min_vals)
+                df_norm[valid_columns] = (sub - min_vals) / ranges
 
             elif method == "zscore":
-                mean_val = df_norm[col].mean()
-                std_val = df_norm[col].std()
-                df_norm[col] = (df_norm[col] - mean_val) / std_val
+                means = np.nanmean(sub, axis=0)
+                stds = np.nanstd(sub, axis=0, ddof=1)
+                stds = np.where(stds == 0, 1.0, stds)
+                df_norm[valid_columns] = (sub - means) / stds
 
-        logger.info(f"Normalized {len(columns)} columns")
+        logger.info(f"Normalized {len(valid_columns)} columns")
         return df_norm
 
     @staticmethod
@@ -154,7 +204,8 @@ class DataCleaner:
             Series with normalized text
         """
         logger.debug("Normalizing text series...")
-        return series.apply(DataCleaner.normalize_text)
+        # Vectorized .str pipeline instead of a per-row Python apply
+        return series.str.lower().str.strip().str.split().str.join(' ')
 
     @staticmethod
     def remove_outliers(
@@ -178,32 +229,138 @@ class DataCleaner:
         logger.debug(f"Removing outliers using {method}...")
         initial_rows = len(df)
 
-        df_clean = df.copy()
+        valid_columns = [col for col in columns if col in df.columns]
 
-        for col in columns:
-            if col not in df_clean.columns:
-                continue
+        # Accumulate a single boolean mask so the frame is indexed once
+        # instead of being copied and reallocated per column
+        mask = np.ones(initial_rows, dtype=bool)
 
-            if method == "iqr":
-                Q1 = df_clean[col].quantile(0.25)
-                Q3 = df_clean[col].quantile(0.75)
-                IQR = Q3 - Q1
+        if method == "iqr" and valid_columns:
+            quantiles = df[valid_columns].quantile([0.25, 0.75])
 
-                lower_bound = Q1 - threshold * IQR
-                upper_bound = Q3 + threshold * IQR
+            Q1 = quantiles.loc[0.25].to_numpy()
+            Q3 = quantiles.loc[0.75].to_numpy()
+            IQR = Q3 - Q1
 
-                df_clean = df_clean[
-                    (df_clean[col] >= lower_bound) & (df_clean[col] <= upper_bound)
-                ]
+            lower_bounds = Q1 - threshold * IQR
+            upper_bounds = Q3 + threshold * IQR
 
-            elif method == "zscore":
-                z_scores = np.abs((df_clean[col] - df_clean[col].mean()) / df_clean[col].std())
-                df_clean = df_clean[z_scores < threshold]
+            # Single fused kernel over the whole block (JIT-compiled when
+            # numba is available) instead of one intermediate per column
+            mat = df[valid_columns].to_numpy(dtype=np.float64)
+            mask &= _compute_bounds_mask(mat, lower_bounds, upper_bounds)
+
+        elif method == "zscore":
+            for col in valid_columns:
+                values = df[col].to_numpy(dtype=np.float64)
+                # nan-aware reductions match pandas skipna: NaN cells get
+                # a NaN z-score (row dropped) without poisoning the stats
+                center = np.nanmean(values)
+                spread = np.nanstd(values, ddof=1)
+                z_scores = np.abs((values - center) / spread)
+                mask &= z_scores < threshold
+
+        df_clean = df.loc[mask]
 
         removed = initial_rows - len(df_clean)
         logger.info(f"Removed {removed} rows with outliers")
         return df_clean
 
+    @staticmethod
+    def pipeline(
+        df: pd.DataFrame,
+        steps: List[Dict[str, Any]]
+    ) -> pd.DataFrame:
+        """
+        Run a multi-step cleaning pipeline.
+
+        When polars is installed the steps are fused into a single lazy
+        query plan and collected once, avoiding one materialized frame
+        per step. Otherwise the existing pandas methods run in sequence.
+
+        Args:
+            df: Input dataframe
+            steps: List of step dictionaries, each with an 'op' key of
+                'handle_nulls', 'remove_outliers', or 'normalize_numeric'
+                plus that method's keyword arguments
+
+        Returns:
+            Cleaned dataframe
+        """
+        logger.debug(f"Running cleaning pipeline with {len(steps)} steps...")
+
+        if POLARS_AVAILABLE:
+            return DataCleaner._pipeline_polars(df, steps)
+
+        for step in steps:
+            op = step["op"]
+            kwargs = {k: v for k, v in step.items() if k != "op"}
+
+            if op == "handle_nulls":
+                df = DataCleaner.handle_nulls(df, **kwargs)
+            elif op == "remove_outliers":
+                df = DataCleaner.remove_outliers(df, **kwargs)
+            elif op == "normalize_numeric":
+                df = DataCleaner.normalize_numeric(df, **kwargs)
+            else:
+                logger.warning(f"Unknown pipeline step: {op}")
+
+        return df
+
+    @staticmethod
+    def _pipeline_polars(
+        df: pd.DataFrame,
+        steps: List[Dict[str, Any]]
+    ) -> pd.DataFrame:
+        """Build the pipeline as one polars lazy graph and collect once."""
+        lf = pl.from_pandas(df).lazy()
+
+        for step in steps:
+            op = step["op"]
+
+            if op == "handle_nulls":
+                strategy = step.get("strategy", "drop")
+                if strategy == "drop":
+                    lf = lf.drop_nulls()
+                elif strategy == "fill_value":
+                    lf = lf.fill_null(step.get("fill_value"))
+                else:
+                    logger.warning(
+                        f"Null strategy {strategy} not supported in lazy "
+                        f"pipeline, using drop"
+                    )
+                    lf = lf.drop_nulls()
+
+            elif op == "remove_outliers":
+                threshold = step.get("threshold", 1.5)
+                for col in step["columns"]:
+                    q1 = pl.col(col).quantile(0.25)
+                    q3 = pl.col(col).quantile(0.75)
+                    iqr = q3 - q1
+                    lf = lf.filter(
+                        pl.col(col).is_between(
+                            q1 - threshold * iqr,
+                            q3 + threshold * iqr
+                        )
+                    )
+
+            elif op == "normalize_numeric":
+                method = step.get("method", "minmax")
+                for col in step["columns"]:
+                    if method == "zscore":
+                        expr = (pl.col(col) - pl.col(col).mean()) / pl.col(col).std()
+                    else:
+                        expr = (
+                            (pl.col(col) - pl.col(col).min())
+                            / (pl.col(col).max() - pl.col(col).min())
+                        )
+                    lf = lf.with_columns(expr.alias(col))
+
+            else:
+                logger.warning(f"Unknown pipeline step: {op}")
+
+        return lf.collect().to_pandas()
+
     @staticmethod
     def validate_data_types(df: pd.DataFrame, expected_types: Dict[str, str]) -> bool:
         """
@@ -242,11 +399,16 @@ class DataCleaner:
         Returns:
             Quality report dictionary
         """
-        total_cells = df.shape[0] * df.shape[1]
-        null_cells = df.isnull().sum().sum()
+        # Single isna pass reduced in one vectorized step
+        isna_mask = df.isna().to_numpy(copy=False)
+        total_cells = isna_mask.size
+        null_cells = int(isna_mask.sum())
         null_percentage = (null_cells / total_cells * 100) if total_cells > 0 else 0
 
-        duplicates = df.duplicated().sum()
+        duplicates = df.duplicated(keep="first").sum()
+
+        # deep=True is only needed to size object (string) columns
+        deep = not df.select_dtypes(include="object").empty
 
         return {
             "rows": df.shape[0],
@@ -255,5 +417,5 @@ class DataCleaner:
             "null_cells": null_cells,
             "null_percentage": null_percentage,
             "duplicate_rows": duplicates,
-            "memory_usage_mb": df.memory_usage(deep=True).sum() / 1024 / 1024,
+            "memory_usage_mb": df.memory_usage(deep=deep).sum() / 1024 / 1024,
         }
\ No newline at end of file
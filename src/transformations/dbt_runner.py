@@ -5,17 +5,45 @@ BRANCH-5: Data Transformation
 Author: Boris (Claude Code)
 """
 
+import asyncio
+import functools
+import json
+import mmap
+import os
 import subprocess
+from collections import deque
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from ..core.config import get_settings
 from ..core.logger import get_logger
 from ..core.exceptions import DBTExecutionError
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_manifest(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a dbt manifest, cached on (path, mtime).
+
+    The mtime key invalidates the cache whenever dbt rewrites the file,
+    so warm calls skip the parse entirely. The file is memory-mapped and
+    parsed with orjson when available — manifests of non-trivial projects
+    run to tens of MB, where stdlib json.load dominates.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(memoryview(mm))
+        return json.loads(mm[:])
+
+
 class DBTRunner:
     """Run dbt transformations and manage data pipelines."""
 
@@ -23,16 +51,39 @@ class DBTRunner:
         """
         Initialize DBT runner.
 
+        Settings and the project-directory check are deferred to first
+        use, so constructing a runner costs nothing when no dbt command
+        is actually invoked.
+
         Args:
             dbt_project_dir: Path to dbt project directory
         """
         self.dbt_dir = Path(dbt_project_dir)
-        self.settings = get_settings()
+        self._dir_checked = False
+
+        logger.info(f"DBT runner initialized at {self.dbt_dir}")
+
+    @functools.cached_property
+    def settings(self):
+        """Application settings, loaded on first access."""
+        return get_settings()
+
+    def _ensure_dir(self) -> None:
+        """
+        Verify the dbt project directory exists, once per instance.
+
+        Raises:
+            DBTExecutionError: If the directory is missing
+        """
+        if self._dir_checked:
+            return
 
         if not self.dbt_dir.exists():
-            raise DBTExecutionError(f"dbt project directory not found: {dbt_project_dir}")
+            raise DBTExecutionError(
+                f"dbt project directory not found: {self.dbt_dir}"
+            )
 
-        logger.info(f"DBT runner initialized at {self.dbt_dir}")
+        self._dir_checked = True
 
     def run_transformations(self, select: str = "", threads: int = 4) -> bool:
         """
@@ -59,21 +110,16 @@ class DBTRunner:
             cmd.extend(["--threads", str(threads)])
 
             logger.info(f"Running command: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
-                cwd=self.dbt_dir,
-                capture_output=True,
-                text=True
-            )
+            returncode, output_tail = self._run_streamed(cmd)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info("✅ dbt run successful")
                 return True
             else:
-                logger.error(f"dbt run failed:\n{result.stderr}")
+                logger.error(f"dbt run failed:\n{output_tail}")
                 raise DBTExecutionError(
-                    f"dbt run failed with return code {result.returncode}",
-                    details={"stderr": result.stderr}
+                    f"dbt run failed with return code {returncode}",
+                    details={"output": output_tail}
                 )
 
         except subprocess.CalledProcessError as e:
@@ -81,6 +127,113 @@ class DBTRunner:
         except Exception as e:
             raise DBTExecutionError(f"Failed to run dbt: {e}")
 
+    def _run_streamed(self, cmd: List[str], tail_lines: int = 100) -> Tuple[int, str]:
+        """
+        Run a dbt command, streaming its output to the logger.
+
+        Output is forwarded line-by-line as dbt produces it instead of
+        buffering the whole run in memory, so long runs surface progress
+        immediately and memory stays bounded. Stderr is merged into
+        stdout to keep a single ordered stream.
+
+        Args:
+            cmd: Command and arguments
+            tail_lines: Number of trailing lines to keep for error reporting
+
+        Returns:
+            Tuple of (returncode, tail of the output)
+        """
+        self._ensure_dir()
+
+        proc = subprocess.Popen(
+            cmd,
+            cwd=self.dbt_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+
+        tail: deque = deque(maxlen=tail_lines)
+
+        for line in iter(proc.stdout.readline, ""):
+            line = line.rstrip()
+            if line:
+                logger.info(line)
+                tail.append(line)
+
+        proc.stdout.close()
+        returncode = proc.wait()
+        return returncode, "\n".join(tail)
+
+    async def _run_async(self, *cmd: str) -> Tuple[int, str, str]:
+        """
+        Run a dbt command as an async subprocess.
+
+        Args:
+            *cmd: Command and arguments
+
+        Returns:
+            Tuple of (returncode, stdout, stderr)
+        """
+        self._ensure_dir()
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=self.dbt_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+        return proc.returncode, stdout.decode(), stderr.decode()
+
+    async def run_and_document(self, select: str = "", threads: int = 8) -> bool:
+        """
+        Run transformations and generate docs concurrently.
+
+        dbt run and docs generate touch disjoint outputs, so awaiting
+        them together overlaps their wall-clock time instead of
+        serializing two blocking subprocess calls.
+
+        Args:
+            select: Optional selection criteria (e.g., "stg_*")
+            threads: Number of parallel threads for dbt run
+
+        Returns:
+            True if the run succeeded
+
+        Raises:
+            DBTExecutionError: If dbt run fails
+        """
+        run_cmd = ["dbt", "run"]
+        if select:
+            run_cmd.extend(["--select", select])
+        run_cmd.extend(["--threads", str(threads)])
+
+        logger.info("Running dbt run and docs generate concurrently...")
+
+        (run_rc, _, run_err), (docs_rc, _, docs_err) = await asyncio.gather(
+            self._run_async(*run_cmd),
+            self._run_async("dbt", "docs", "generate"),
+        )
+
+        if docs_rc != 0:
+            logger.error(f"Documentation generation failed: {docs_err}")
+
+        if run_rc != 0:
+            logger.error(f"dbt run failed:\n{run_err}")
+            raise DBTExecutionError(
+                f"dbt run failed with return code {run_rc}",
+                details={"stderr": run_err}
+            )
+
+        logger.info("✅ dbt run and docs generate successful")
+        return True
+
+    def run_and_document_sync(self, select: str = "", threads: int = 8) -> bool:
+        """Synchronous wrapper around run_and_document."""
+        return asyncio.run(self.run_and_document(select=select, threads=threads))
+
     def run_tests(self) -> bool:
         """
         Run dbt tests for data quality.
@@ -94,18 +247,13 @@ class DBTRunner:
         try:
             logger.info("Running dbt tests...")
 
-            result = subprocess.run(
-                ["dbt", "test"],
-                cwd=self.dbt_dir,
-                capture_output=True,
-                text=True
-            )
+            returncode, output_tail = self._run_streamed(["dbt", "test"])
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info("✅ dbt tests passed")
                 return True
             else:
-                logger.warning(f"dbt tests failed:\n{result.stderr}")
+                logger.warning(f"dbt tests failed:\n{output_tail}")
                 return False
 
         except Exception as e:
@@ -122,18 +270,13 @@ class DBTRunner:
         try:
             logger.info("Generating dbt documentation...")
 
-            result = subprocess.run(
-                ["dbt", "docs", "generate"],
-                cwd=self.dbt_dir,
-                capture_output=True,
-                text=True
-            )
+            returncode, output_tail = self._run_streamed(["dbt", "docs", "generate"])
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info("✅ Documentation generated successfully")
                 return True
             else:
-                logger.error(f"Documentation generation failed: {result.stderr}")
+                logger.error(f"Documentation generation failed: {output_tail}")
                 return False
 
         except Exception as e:
@@ -148,16 +291,14 @@ class DBTRunner:
             Manifest dictionary or None
         """
         try:
-            import json
-
             manifest_path = self.dbt_dir / "target" / "manifest.json"
 
             if not manifest_path.exists():
                 logger.warning("Manifest not found, running dbt compile...")
                 self.compile()
 
-            with open(manifest_path) as f:
-                return json.load(f)
+            mtime_ns = os.stat(manifest_path).st_mtime_ns
+            return _load_manifest(str(manifest_path), mtime_ns)
 
         except Exception as e:
             logger.error(f"Failed to get manifest: {e}")
@@ -173,18 +314,13 @@ class DBTRunner:
         try:
             logger.info("Compiling dbt project...")
 
-            result = subprocess.run(
-                ["dbt", "compile"],
-                cwd=self.dbt_dir,
-                capture_output=True,
-                text=True
-            )
+            returncode, output_tail = self._run_streamed(["dbt", "compile"])
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info("✅ dbt compile successful")
                 return True
             else:
-                logger.error(f"dbt compile failed: {result.stderr}")
+                logger.error(f"dbt compile failed: {output_tail}")
                 return False
 
         except Exception as e:
@@ -201,18 +337,13 @@ class DBTRunner:
         try:
             logger.info("Creating dbt snapshots...")
 
-            result = subprocess.run(
-                ["dbt", "snapshot"],
-                cwd=self.dbt_dir,
-                capture_output=True,
-                text=True
-            )
+            returncode, output_tail = self._run_streamed(["dbt", "snapshot"])
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info("✅ Snapshots created successfully")
                 return True
             else:
-                logger.error(f"Snapshot creation failed: {result.stderr}")
+                logger.error(f"Snapshot creation failed: {output_tail}")
                 return False
 
         except Exception as e:
@@ -229,18 +360,13 @@ class DBTRunner:
         try:
             logger.info("Loading seed data...")
 
-            result = subprocess.run(
-                ["dbt", "seed"],
-                cwd=self.dbt_dir,
-                capture_output=True,
-                text=True
-            )
+            returncode, output_tail = self._run_streamed(["dbt", "seed"])
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info("✅ Seed data loaded successfully")
                 return True
             else:
-                logger.error(f"Seed loading failed: {result.stderr}")
+                logger.error(f"Seed loading failed: {output_tail}")
                 return False
 
         except Exception as e:
@@ -257,18 +383,13 @@ class DBTRunner:
         try:
             logger.warning("Running full refresh (this will drop all models)...")
 
-            result = subprocess.run(
-                ["dbt", "run", "--full-refresh"],
-                cwd=self.dbt_dir,
-                capture_output=True,
-                text=True
-            )
+            returncode, output_tail = self._run_streamed(["dbt", "run", "--full-refresh"])
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info("✅ Full refresh successful")
                 return True
             else:
-                logger.error(f"Full refresh failed: {result.stderr}")
+                logger.error(f"Full refresh failed: {output_tail}")
                 return False
 
         except Exception as e:
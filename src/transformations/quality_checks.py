@@ -5,15 +5,44 @@ BRANCH-5: Data Transformation
 Author: Boris (Claude Code)
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import functools
+import os
+import re
+
+import numpy as np
+import pandas as pd
 
 from ..core.logger import get_logger
+from ._qc_kernels import range_and_null_count
+
+try:
+    from datasketch import HyperLogLog
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
 
 logger = get_logger(__name__)
 
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a regex pattern, cached across check calls."""
+    return re.compile(pattern)
+
+
+# Inferred dtypes that already guarantee every non-null value passes an
+# isinstance check for the given expected type (bool is an int subclass)
+_TYPE_GUARANTEES = {
+    int: {"integer", "boolean", "empty"},
+    float: {"floating", "empty"},
+    str: {"string", "empty"},
+    bool: {"boolean", "empty"},
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class QualityCheckResult:
     """Result of a quality check."""
 
@@ -34,12 +63,164 @@ class QualityCheckResult:
         }
 
 
+class _ColumnarData:
+    """
+    Row facade over bound column arrays.
+
+    Supports the little the checks need from row data — len(), index
+    access (first-row column probing) and iteration — while the real
+    values stay in the contiguous arrays seeded into the column cache.
+    """
+
+    __slots__ = ("_columns", "_len")
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self._columns = columns
+        self._len = len(next(iter(columns.values()))) if columns else 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index >= self._len:
+            raise IndexError(index)
+        return {name: col[index] for name, col in self._columns.items()}
+
+
 class QualityChecker:
     """Check data quality and integrity."""
 
+    # Per-dataset caches kept before least-recently-used eviction kicks
+    # in; bounds memory on long-lived checkers that see many datasets
+    _MAX_CACHED_DATASETS = 8
+
     def __init__(self):
         """Initialize quality checker."""
         self.results: List[QualityCheckResult] = []
+        # id(data) -> (data, cache dict). Holding the dataset itself
+        # pins its id for the life of the entry, so a garbage-collected
+        # list's id can never alias a new dataset's cached columns.
+        self._dataset_caches: Dict[int, Tuple[Any, Dict[tuple, Any]]] = {}
+
+    def _dataset_cache(self, data) -> Dict[tuple, Any]:
+        """Per-dataset cache dict, creating and LRU-evicting as needed."""
+        key = id(data)
+        entry = self._dataset_caches.pop(key, None)
+
+        if entry is None:
+            if len(self._dataset_caches) >= self._MAX_CACHED_DATASETS:
+                # Evict the least recently touched dataset
+                self._dataset_caches.pop(next(iter(self._dataset_caches)))
+            entry = (data, {})
+
+        # Re-inserting moves the entry to the fresh end of the dict
+        self._dataset_caches[key] = entry
+        return entry[1]
+
+    def _get_numeric(self, data: List[Dict], field: str) -> Optional[np.ndarray]:
+        """
+        Float64 view of a column for SIMD comparisons, cached.
+
+        Returns None when the column holds non-numeric values, in which
+        case callers fall back to the object-dtype path.
+        """
+        cache = self._dataset_cache(data)
+        key = ("numeric", field)
+
+        if key not in cache:
+            col = self._get_column(data, field)
+            try:
+                mask = pd.isna(col)
+                arr = np.where(mask, np.nan, col).astype(np.float64)
+            except (TypeError, ValueError):
+                arr = None
+            cache[key] = arr
+
+        return cache[key]
+
+    def _null_count(self, data: List[Dict], field: str) -> int:
+        """Null count for a column, computed once per (data, field)."""
+        cache = self._dataset_cache(data)
+        key = ("null_count", field)
+        count = cache.get(key)
+
+        if count is None:
+            count = int(pd.isna(self._get_column(data, field)).sum())
+            cache[key] = count
+
+        return count
+
+    def _inferred_dtype(self, data: List[Dict], field: str) -> str:
+        """Inferred dtype for a column, computed once per (data, field)."""
+        cache = self._dataset_cache(data)
+        key = ("dtype", field)
+        inferred = cache.get(key)
+
+        if inferred is None:
+            inferred = pd.api.types.infer_dtype(
+                self._get_column(data, field), skipna=True
+            )
+            cache[key] = inferred
+
+        return inferred
+
+    def _get_column(self, data: List[Dict], field: str) -> np.ndarray:
+        """
+        Extract a field into a column array, once per (data, field).
+
+        The object array keeps the original Python values, so type and
+        null semantics are identical to per-item access, while the
+        vectorized checks below scan one contiguous array instead of
+        doing a dict lookup per row.
+
+        Args:
+            data: List of data dictionaries
+            field: Field to extract
+
+        Returns:
+            Object array of the field values (None where missing)
+        """
+        cache = self._dataset_cache(data)
+        key = ("column", field)
+        col = cache.get(key)
+
+        if col is None:
+            col = np.empty(len(data), dtype=object)
+            for i, item in enumerate(data):
+                col[i] = item.get(field)
+            cache[key] = col
+
+        return col
+
+    def bind_columns(
+        self,
+        columns: "Dict[str, Any] | pd.DataFrame"
+    ) -> _ColumnarData:
+        """
+        Bind already-columnar data, skipping the row-dict roundtrip.
+
+        Producers that hold a DataFrame or a mapping of column arrays
+        can bind them directly; the arrays are seeded into the column
+        cache so every check scans them as-is instead of re-extracting
+        field values row by row.
+
+        Args:
+            columns: Mapping of field name to array-like, or a DataFrame
+
+        Returns:
+            Handle to pass as ``data`` to the check methods
+        """
+        if isinstance(columns, pd.DataFrame):
+            arrays = {name: columns[name].to_numpy() for name in columns.columns}
+        else:
+            arrays = {name: np.asarray(col) for name, col in columns.items()}
+
+        data = _ColumnarData(arrays)
+        cache = self._dataset_cache(data)
+        for name, col in arrays.items():
+            cache[("column", name)] = col
+
+        return data
 
     def check_no_nulls(
         self,
@@ -58,15 +239,15 @@ class QualityChecker:
         Returns:
             Check result
         """
-        has_nulls = [item for item in data if item.get(field) is None]
-        passed = len(has_nulls) == 0
+        null_count = self._null_count(data, field)
+        passed = null_count == 0
 
         result = QualityCheckResult(
             check_name=f"No nulls in {field}",
             passed=passed,
-            message=f"Found {len(has_nulls)} null values" if has_nulls else "No nulls found",
-            rows_affected=len(has_nulls),
-            percentage=(len(has_nulls) / len(data) * 100) if data else 0
+            message=f"Found {null_count} null values" if null_count else "No nulls found",
+            rows_affected=null_count,
+            percentage=(null_count / len(data) * 100) if data else 0
         )
 
         self.results.append(result)
@@ -91,28 +272,36 @@ class QualityChecker:
         Returns:
             Check result
         """
-        out_of_range = [
-            item for item in data
-            if item.get(field) is not None and not (min_val <= item.get(field) <= max_val)
-        ]
+        arr = self._get_numeric(data, field)
+
+        if arr is not None:
+            # Fused null + range pass, JIT-compiled when numba is installed
+            _, out_of_range = range_and_null_count(arr, min_val, max_val)
+        else:
+            col = pd.Series(self._get_column(data, field))
+            out_of_range = int((col.notna() & ~col.between(min_val, max_val)).sum())
 
-        passed = len(out_of_range) == 0
+        passed = out_of_range == 0
 
         result = QualityCheckResult(
             check_name=f"{field} in range [{min_val}, {max_val}]",
             passed=passed,
-            message=f"Found {len(out_of_range)} values out of range" if out_of_range else "All values in range",
-            rows_affected=len(out_of_range),
-            percentage=(len(out_of_range) / len(data) * 100) if data else 0
+            message=f"Found {out_of_range} values out of range" if out_of_range else "All values in range",
+            rows_affected=out_of_range,
+            percentage=(out_of_range / len(data) * 100) if data else 0
         )
 
         self.results.append(result)
         return result
 
+    # Approximate cardinality only pays off past this column size
+    _HLL_MIN_VALUES = 100_000
+
     def check_unique_values(
         self,
         data: List[Dict],
-        field: str
+        field: str,
+        exact: bool = True
     ) -> QualityCheckResult:
         """
         Check for unique values in field.
@@ -120,15 +309,36 @@ class QualityChecker:
         Args:
             data: List of data dictionaries
             field: Field to check
+            exact: With exact=False and datasketch installed, large
+                columns are first screened with a HyperLogLog estimate
+                in O(1) memory; the exact count only runs when the
+                estimate suggests duplicates exist
 
         Returns:
             Check result
         """
-        values = [item.get(field) for item in data if item.get(field) is not None]
-        unique_count = len(set(values))
-        total_count = len(values)
-
-        duplicates = total_count - unique_count
+        col = self._get_column(data, field)
+        values = col[~pd.isna(col)]
+        total_count = values.size
+
+        duplicates = None
+
+        if (
+            not exact
+            and DATASKETCH_AVAILABLE
+            and total_count >= self._HLL_MIN_VALUES
+        ):
+            hll = HyperLogLog()
+            for hashed in pd.util.hash_array(values):
+                hll.update(hashed.tobytes())
+
+            estimate = hll.count()
+            # Within HLL error of all-unique: call it duplicate-free
+            if abs(total_count - estimate) <= 0.02 * total_count:
+                duplicates = 0
+
+        if duplicates is None:
+            duplicates = total_count - pd.unique(values).size
         passed = duplicates == 0
 
         result = QualityCheckResult(
@@ -165,10 +375,28 @@ class QualityChecker:
         self.results.append(result)
         return result
 
+    def _column_set(self, data: List[Dict], strict: bool) -> frozenset:
+        """Observed column names, computed once per (data, strict)."""
+        cache = self._dataset_cache(data)
+        key = ("column_set", strict)
+        cols = cache.get(key)
+
+        if cols is None:
+            if not data:
+                cols = frozenset()
+            elif strict:
+                cols = frozenset().union(*data)
+            else:
+                cols = frozenset(data[0])
+            cache[key] = cols
+
+        return cols
+
     def check_column_exists(
         self,
         data: List[Dict],
-        columns: List[str]
+        columns: List[str],
+        strict: bool = False
     ) -> QualityCheckResult:
         """
         Check required columns exist.
@@ -176,6 +404,8 @@ class QualityChecker:
         Args:
             data: List of data dictionaries
             columns: Required columns
+            strict: Union the keys of every row instead of probing only
+                the first one — correct for sparse rows, costs one pass
 
         Returns:
             Check result
@@ -183,8 +413,8 @@ class QualityChecker:
         if not data:
             missing = columns
         else:
-            first_record = data[0]
-            missing = [col for col in columns if col not in first_record]
+            cols = self._column_set(data, strict)
+            missing = [col for col in columns if col not in cols]
 
         passed = len(missing) == 0
 
@@ -216,19 +446,25 @@ class QualityChecker:
         Returns:
             Check result
         """
-        invalid_types = [
-            item for item in data
-            if item.get(field) is not None and not isinstance(item.get(field), expected_type)
-        ]
+        # Schema short-circuit: when the inferred dtype already guarantees
+        # every non-null value has the expected type, skip the scan
+        if self._inferred_dtype(data, field) in _TYPE_GUARANTEES.get(expected_type, ()):
+            invalid_count = 0
+        else:
+            col = self._get_column(data, field)
+            invalid_count = sum(
+                1 for value in col
+                if value is not None and not isinstance(value, expected_type)
+            )
 
-        passed = len(invalid_types) == 0
+        passed = invalid_count == 0
 
         result = QualityCheckResult(
             check_name=f"{field} is {expected_type.__name__}",
             passed=passed,
-            message=f"Found {len(invalid_types)} records with wrong type",
-            rows_affected=len(invalid_types),
-            percentage=(len(invalid_types) / len(data) * 100) if data else 0
+            message=f"Found {invalid_count} records with wrong type",
+            rows_affected=invalid_count,
+            percentage=(invalid_count / len(data) * 100) if data else 0
         )
 
         self.results.append(result)
@@ -251,27 +487,96 @@ class QualityChecker:
         Returns:
             Check result
         """
-        import re
+        col = pd.Series(self._get_column(data, field))
+        present = col[col.notna()].astype(str)
+        non_matching = int((~present.str.match(_compile_pattern(pattern))).sum())
 
-        compiled_pattern = re.compile(pattern)
-        non_matching = [
-            item for item in data
-            if item.get(field) is not None and not compiled_pattern.match(str(item.get(field)))
-        ]
-
-        passed = len(non_matching) == 0
+        passed = non_matching == 0
 
         result = QualityCheckResult(
             check_name=f"{field} matches pattern {pattern}",
             passed=passed,
-            message=f"Found {len(non_matching)} non-matching values",
-            rows_affected=len(non_matching),
-            percentage=(len(non_matching) / len(data) * 100) if data else 0
+            message=f"Found {non_matching} non-matching values",
+            rows_affected=non_matching,
+            percentage=(non_matching / len(data) * 100) if data else 0
         )
 
         self.results.append(result)
         return result
 
+    def run_batch(
+        self,
+        specs: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[QualityCheckResult]:
+        """
+        Run a batch of checks with fused column extraction.
+
+        All fields referenced by the batch are pulled out of the row
+        dicts in a single traversal per dataset, so K checks cost one
+        pass over the rows plus K vectorized column scans instead of K
+        row traversals.
+
+        Args:
+            specs: List of (method_name, kwargs) tuples
+
+        Returns:
+            Check results in submission order
+        """
+        # Group the referenced fields per dataset
+        referenced: Dict[int, Tuple[List[Dict], set]] = {}
+        for _, kwargs in specs:
+            data = kwargs.get("data")
+            field = kwargs.get("field")
+            if data is not None and field is not None:
+                referenced.setdefault(id(data), (data, set()))[1].add(field)
+
+        # One row pass per dataset fills every missing column at once
+        for data, fields in referenced.values():
+            cache = self._dataset_cache(data)
+            missing = [f for f in fields if ("column", f) not in cache]
+            if len(missing) > 1:
+                cols = {f: np.empty(len(data), dtype=object) for f in missing}
+                for i, item in enumerate(data):
+                    get = item.get
+                    for f, arr in cols.items():
+                        arr[i] = get(f)
+                for f, arr in cols.items():
+                    cache[("column", f)] = arr
+
+        return [getattr(self, method)(**kwargs) for method, kwargs in specs]
+
+    def run_checks(
+        self,
+        specs: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[QualityCheckResult]:
+        """
+        Run independent checks concurrently.
+
+        The checks are independent of each other and spend their time in
+        GIL-releasing pandas/numpy code, so a thread pool scales them
+        across cores. Results land in self.results in submission order
+        regardless of completion order.
+
+        Args:
+            specs: List of (method_name, kwargs) tuples, e.g.
+                [("check_no_nulls", {"data": data, "field": "price"})]
+
+        Returns:
+            Check results in submission order
+        """
+        start = len(self.results)
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = [
+                pool.submit(getattr(self, method), **kwargs)
+                for method, kwargs in specs
+            ]
+            ordered = [future.result() for future in futures]
+
+        # The methods appended in completion order; restore submission order
+        self.results[start:] = ordered
+        return ordered
+
     def get_summary(self) -> Dict[str, Any]:
         """
         Get quality check summary.
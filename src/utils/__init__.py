@@ -8,6 +8,7 @@ from .decorators import retry_on_error, cache_result, timing, log_errors
 from .helpers import (
     chunk_list,
     flatten_list,
+    flatten_iter,
     safe_divide,
     merge_dicts,
     get_nested_value,
@@ -20,14 +21,19 @@ from .helpers import (
 )
 from .constants import (
     ENTITY_TYPES,
+    ENTITY_TYPES_SET,
     CONFIDENCE_LEVELS,
     HTTP_STATUS_CODES,
     DEFAULT_BATCH_SIZE,
     DEFAULT_CONFIDENCE_THRESHOLD,
     NLP_MODEL_NAME,
     CLASSIFIER_MODEL_NAME,
+    MEDICATION_KEYWORDS_SET,
+    CONDITION_KEYWORDS_SET,
+    PRICE_KEYWORDS_SET,
 )
 from .text_utils import (
+    TextExtractor,
     normalize_text,
     clean_html,
     extract_keywords,
@@ -35,12 +41,26 @@ from .text_utils import (
     truncate_text,
     count_sentences,
     count_words,
+    text_stats,
     extract_urls,
     extract_emails,
     extract_mentions,
     extract_hashtags,
+    extract_urls_batch,
+    extract_emails_batch,
+    extract_mentions_batch,
+    extract_hashtags_batch,
+    extract_urls_soa,
+    extract_emails_soa,
+    extract_mentions_soa,
+    extract_hashtags_soa,
     extract_numbers,
+    extract_all,
+    tokenize_all,
     similarity_score,
+    similarity_matrix,
+    build_similarity_index,
+    query_similar,
 )
 
 __all__ = [
@@ -52,6 +72,7 @@ __all__ = [
     # Helpers
     "chunk_list",
     "flatten_list",
+    "flatten_iter",
     "safe_divide",
     "merge_dicts",
     "get_nested_value",
@@ -63,13 +84,18 @@ __all__ = [
     "deserialize_object",
     # Constants
     "ENTITY_TYPES",
+    "ENTITY_TYPES_SET",
     "CONFIDENCE_LEVELS",
     "HTTP_STATUS_CODES",
     "DEFAULT_BATCH_SIZE",
     "DEFAULT_CONFIDENCE_THRESHOLD",
     "NLP_MODEL_NAME",
     "CLASSIFIER_MODEL_NAME",
+    "MEDICATION_KEYWORDS_SET",
+    "CONDITION_KEYWORDS_SET",
+    "PRICE_KEYWORDS_SET",
     # Text utils
+    "TextExtractor",
     "normalize_text",
     "clean_html",
     "extract_keywords",
@@ -77,10 +103,24 @@ __all__ = [
     "truncate_text",
     "count_sentences",
     "count_words",
+    "text_stats",
     "extract_urls",
     "extract_emails",
     "extract_mentions",
     "extract_hashtags",
+    "extract_urls_batch",
+    "extract_emails_batch",
+    "extract_mentions_batch",
+    "extract_hashtags_batch",
+    "extract_urls_soa",
+    "extract_emails_soa",
+    "extract_mentions_soa",
+    "extract_hashtags_soa",
     "extract_numbers",
+    "extract_all",
+    "tokenize_all",
     "similarity_score",
+    "similarity_matrix",
+    "build_similarity_index",
+    "query_similar",
 ]
\ No newline at end of file
@@ -92,6 +92,13 @@ PRICE_KEYWORDS = [
     "shilling", "dollar", "pound"
 ]
 
+# Frozen views for O(1) membership tests in token loops; the lists above
+# stay authoritative where ordering matters (iteration, logging).
+ENTITY_TYPES_SET = frozenset(ENTITY_TYPES)
+MEDICATION_KEYWORDS_SET = frozenset(MEDICATION_KEYWORDS)
+CONDITION_KEYWORDS_SET = frozenset(CONDITION_KEYWORDS)
+PRICE_KEYWORDS_SET = frozenset(PRICE_KEYWORDS)
+
 # Message types
 MESSAGE_TYPE_TEXT = "text"
 MESSAGE_TYPE_MEDIA = "media"
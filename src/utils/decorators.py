@@ -5,10 +5,11 @@ BRANCH-8: Utilities
 Author: Boris (Claude Code)
 """
 
+import asyncio
 import functools
 import time
+from collections import OrderedDict
 from typing import Callable, Any, Optional, Dict
-from datetime import datetime, timedelta
 
 from src.core.logger import get_logger
 
@@ -43,7 +44,44 @@ class RetryDecorator:
         self.retryable_exceptions = retryable_exceptions
 
     def __call__(self, func: Callable) -> Callable:
-        """Decorator implementation."""
+        """
+        Decorator implementation.
+
+        Coroutine functions get an async wrapper that backs off with
+        asyncio.sleep, so concurrent tasks keep progressing while one
+        retry waits; sync functions keep the blocking time.sleep path.
+        """
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                delay = self.initial_delay
+                last_exception = None
+
+                for attempt in range(1, self.max_attempts + 1):
+                    try:
+                        return await func(*args, **kwargs)
+
+                    except self.retryable_exceptions as e:
+                        last_exception = e
+
+                        if attempt == self.max_attempts:
+                            logger.error(
+                                f"Failed after {self.max_attempts} attempts: {str(e)}"
+                            )
+                            raise
+
+                        logger.warning(
+                            f"Attempt {attempt}/{self.max_attempts} failed, "
+                            f"retrying in {delay:.2f}s: {str(e)}"
+                        )
+
+                        await asyncio.sleep(delay)
+                        delay = min(delay * self.backoff_factor, self.max_delay)
+
+                raise last_exception
+
+            return async_wrapper
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
@@ -76,6 +114,29 @@ class RetryDecorator:
         return wrapper
 
 
+@functools.lru_cache(maxsize=None)
+def _retry_factory(
+    max_attempts: int,
+    initial_delay: float,
+    max_delay: float,
+    backoff_factor: float,
+) -> RetryDecorator:
+    """
+    One shared RetryDecorator per parameter tuple.
+
+    RetryDecorator holds only its configuration — retry state lives in
+    the wrapper's locals — so instances are safe to share across call
+    sites. CacheDecorator carries per-instance cache state and must NOT
+    be pooled this way.
+    """
+    return RetryDecorator(
+        max_attempts=max_attempts,
+        initial_delay=initial_delay,
+        max_delay=max_delay,
+        backoff_factor=backoff_factor,
+    )
+
+
 def retry_on_error(
     max_attempts: int = 3,
     initial_delay: float = 1.0,
@@ -96,13 +157,7 @@ def retry_on_error(
         def risky_operation():
             pass
     """
-    decorator = RetryDecorator(
-        max_attempts=max_attempts,
-        initial_delay=initial_delay,
-        max_delay=max_delay,
-        backoff_factor=backoff_factor,
-    )
-    return decorator
+    return _retry_factory(max_attempts, initial_delay, max_delay, backoff_factor)
 
 
 class CacheDecorator:
@@ -118,13 +173,20 @@ class CacheDecorator:
         """
         self.ttl_seconds = ttl_seconds
         self.max_size = max_size
-        self.cache: Dict[str, tuple] = {}
+        self.cache: "OrderedDict[str, tuple]" = OrderedDict()
 
-    def _make_key(self, args: tuple, kwargs: dict) -> str:
+    def _make_key(self, args: tuple, kwargs: dict) -> Any:
         """Generate cache key from arguments."""
-        key_parts = [str(arg) for arg in args]
-        key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-        return "|".join(key_parts)
+        try:
+            # Same tuple-based key (with cached hash) that lru_cache uses;
+            # typed=True keeps 1 and "1" from colliding
+            return functools._make_key(args, kwargs, typed=True)
+        except TypeError:
+            # Unhashable argument (list/dict): fall back to a repr key
+            logger.debug("Unhashable cache arguments, using repr key")
+            key_parts = [repr(arg) for arg in args]
+            key_parts.extend(f"{k}={v!r}" for k, v in sorted(kwargs.items()))
+            return "|".join(key_parts)
 
     def __call__(self, func: Callable) -> Callable:
         """Decorator implementation."""
@@ -137,8 +199,9 @@ class CacheDecorator:
             # Check if cached and not expired
             if cache_key in self.cache:
                 value, timestamp = self.cache[cache_key]
-                if datetime.now() - timestamp < timedelta(seconds=self.ttl_seconds):
+                if time.monotonic() - timestamp < self.ttl_seconds:
                     logger.debug(f"Cache hit for {func.__name__}")
+                    self.cache.move_to_end(cache_key)
                     return value
                 else:
                     # Expired, remove from cache
@@ -148,17 +211,12 @@ class CacheDecorator:
             logger.debug(f"Cache miss for {func.__name__}")
             result = func(*args, **kwargs)
 
-            # Manage cache size
+            # Evict least-recently-used entry in O(1)
             if len(self.cache) >= self.max_size:
-                # Remove oldest entry
-                oldest_key = min(
-                    self.cache.keys(),
-                    key=lambda k: self.cache[k][1]
-                )
-                del self.cache[oldest_key]
+                self.cache.popitem(last=False)
 
             # Store in cache
-            self.cache[cache_key] = (result, datetime.now())
+            self.cache[cache_key] = (result, time.monotonic())
 
             return result
 
@@ -5,13 +5,33 @@ BRANCH-8: Utilities
 Author: Boris (Claude Code)
 """
 
-from typing import List, Dict, Any, Union, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Union, Optional
+from functools import lru_cache
+from itertools import chain
 import json
 
+import numpy as np
+import pandas as pd
+
 from ..core.logger import get_logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Sentinel distinguishing "missing key" from a stored None
+_MISSING = object()
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str, separator: str) -> tuple:
+    """Split a dotted path once and cache it for repeated lookups."""
+    return tuple(path.split(separator))
+
 
 def chunk_list(lst: List, chunk_size: int) -> List[List]:
     """
@@ -27,6 +47,11 @@ def chunk_list(lst: List, chunk_size: int) -> List[List]:
     if chunk_size <= 0:
         raise ValueError("chunk_size must be positive")
 
+    if isinstance(lst, (np.ndarray, pd.Series)):
+        # array_split returns zero-copy views over the buffer
+        n_chunks = -(-len(lst) // chunk_size)
+        return np.array_split(lst, n_chunks) if n_chunks else []
+
     return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
 
 
@@ -40,7 +65,21 @@ def flatten_list(lst: List[List]) -> List:
     Returns:
         Flattened list
     """
-    return [item for sublist in lst for item in sublist]
+    # chain.from_iterable runs the inner loop in C
+    return list(chain.from_iterable(lst))
+
+
+def flatten_iter(lst: Iterable[Iterable]) -> Iterator:
+    """
+    Flatten a list of lists lazily.
+
+    Args:
+        lst: Iterable of iterables
+
+    Returns:
+        Iterator over the flattened items
+    """
+    return chain.from_iterable(lst)
 
 
 def safe_divide(
@@ -75,10 +114,15 @@ def merge_dicts(*dicts: dict) -> dict:
     Returns:
         Merged dictionary
     """
+    if len(dicts) == 2:
+        # Common case: single C-level unpack, no loop bytecode
+        a, b = dicts
+        return {**(a or {}), **(b or {})}
+
     result = {}
     for d in dicts:
         if d:
-            result.update(d)
+            result |= d
     return result
 
 
@@ -100,13 +144,13 @@ def get_nested_value(
     Returns:
         Value at path or default
     """
-    keys = path.split(separator)
     current = data
 
-    for key in keys:
-        if isinstance(current, dict) and key in current:
-            current = current[key]
-        else:
+    for key in _split_path(path, separator):
+        if not isinstance(current, dict):
+            return default
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
             return default
 
     return current
@@ -130,7 +174,7 @@ def set_nested_value(
     Returns:
         Modified dictionary
     """
-    keys = path.split(separator)
+    keys = _split_path(path, separator)
     current = data
 
     for key in keys[:-1]:
@@ -155,11 +199,21 @@ def batch_process(
         batch_size: Batch size
         process_fn: Function to apply to each batch
 
+    Array-like inputs (ndarray, Series, DataFrame) are chunked as views
+    without copying; process_fn receives each slice unchanged.
+
     Returns:
         List of results
     """
     results = []
-    batches = chunk_list(items, batch_size)
+
+    if isinstance(items, pd.DataFrame):
+        batches = [
+            items.iloc[i:i + batch_size]
+            for i in range(0, len(items), batch_size)
+        ]
+    else:
+        batches = chunk_list(items, batch_size)
 
     for batch in batches:
         result = process_fn(batch)
@@ -238,6 +292,14 @@ def serialize_object(obj: Any) -> str:
         JSON string
     """
     try:
+        if ORJSON_AVAILABLE:
+            # OPT_NON_STR_KEYS keeps dicts with int/UUID keys working,
+            # matching the stdlib encoder's behavior
+            return orjson.dumps(
+                obj,
+                default=str,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            ).decode()
         return json.dumps(obj, default=str)
     except Exception as e:
         logger.error(f"Serialization failed: {e}")
@@ -256,6 +318,8 @@ def deserialize_object(json_str: str, default: Any = None) -> Any:
         Deserialized object
     """
     try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(json_str)
         return json.loads(json_str)
     except Exception as e:
         logger.error(f"Deserialization failed: {e}")
@@ -6,53 +6,170 @@ Author: Boris (Claude Code)
 """
 
 import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from typing import List, Set, Dict, Optional
 
+import numpy as np
+
 from ..core.logger import get_logger
 
-logger = get_logger(__name__)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
+try:
+    from rapidfuzz.fuzz import token_set_ratio
+    from rapidfuzz.process import cdist as _rf_cdist
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
+logger = get_logger(__name__)
+
+# Patterns compiled once at import; bound methods (_URL_RE.findall)
+# skip the re-module cache lookup on every call
+# Script/style blocks, tags and entities stripped in one fused pass so
+# long HTML is read and written once instead of per-pattern
+_HTML_STRIP_RE = re.compile(
+    r'<script[^>]*>.*?</script>'
+    r'|<style[^>]*>.*?</style>'
+    r'|<[^>]+>'
+    r'|&nbsp;|&lt;|&gt;|&amp;',
+    re.DOTALL | re.IGNORECASE,
+)
+_HTML_ENTITIES = {'&nbsp;': ' ', '&lt;': '<', '&gt;': '>', '&amp;': '&'}
+_SENT_RE = re.compile(r'[.!?]+')
+_WS_RE = re.compile(r'\s+')
+_URL_RE = re.compile(r'https?://[^\s]+')
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_MENTION_RE = re.compile(r'@\w+')
+_HASHTAG_RE = re.compile(r'#\w+')
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+# Character sets for the byte-level email scan
+_EMAIL_LOCAL_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-'
+)
+_EMAIL_DOMAIN_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-'
+)
+_EMAIL_ALPHA = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+# Fused multi-pattern scan for extract_all: one pass finds every URL,
+# email, mention and hashtag. Compiled with google-re2's linear-time
+# DFA engine when installed, stdlib re otherwise.
+_EXTRACT_ALL_SRC = (
+    r'(?P<url>https?://[^\s]+)'
+    r'|(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|(?P<mention>@\w+)'
+    r'|(?P<hashtag>#\w+)'
+)
+# tokenize_all additionally pulls numbers in the same pass
+_TOKENIZE_ALL_SRC = _EXTRACT_ALL_SRC + r'|(?P<number>\d+\.?\d*)'
+try:
+    import re2
+    _EXTRACT_ALL_RE = re2.compile(_EXTRACT_ALL_SRC)
+    _TOKENIZE_ALL_RE = re2.compile(_TOKENIZE_ALL_SRC)
+    RE2_AVAILABLE = True
+except ImportError:
+    _EXTRACT_ALL_RE = re.compile(_EXTRACT_ALL_SRC)
+    _TOKENIZE_ALL_RE = re.compile(_TOKENIZE_ALL_SRC)
+    RE2_AVAILABLE = False
+
+class _DeleteTable(dict):
+    """
+    Self-caching str.translate table that deletes disallowed characters.
+
+    Codepoints outside the prebuilt ASCII range resolve lazily against
+    the keep-pattern (preserving the regex \\s semantics for Unicode
+    whitespace) and are cached for subsequent calls.
+    """
+
+    def __init__(self, keep_pattern: str):
+        super().__init__()
+        self._keep_re = re.compile(keep_pattern)
+        for cp in range(128):
+            self[cp]
+
+    def __missing__(self, cp: int):
+        ch = chr(cp)
+        kept = ch if self._keep_re.match(ch) else None
+        self[cp] = kept
+        return kept
+
+
+# One translate table per (keep_spaces, keep_punctuation) combination;
+# a single C-level pass replaces the regex scan
+_SPECIAL_CHAR_TABLES = {
+    (True, True): _DeleteTable(r'[a-zA-Z0-9\s.,!?;:-]'),
+    (False, True): _DeleteTable(r'[a-zA-Z0-9.,!?;:-]'),
+    (True, False): _DeleteTable(r'[a-zA-Z0-9\s]'),
+    (False, False): _DeleteTable(r'[a-zA-Z0-9]'),
+}
+
+
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """
     Normalize text for processing.
 
+    Pure and memoized: repeated identical messages (common under load)
+    hit the cache instead of re-normalizing.
+
     Args:
         text: Input text
 
     Returns:
         Normalized text
     """
-    # Convert to lowercase
-    text = text.lower()
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    # Replace multiple spaces with single space
-    text = ' '.join(text.split())
-    return text
+    # Lowercase, trim, and collapse whitespace runs in one regex pass
+    # instead of materializing a token list for ' '.join
+    return _WS_RE.sub(' ', text.lower().strip())
 
 
+@lru_cache(maxsize=4096)
 def clean_html(html: str) -> str:
     """
     Remove HTML tags from text.
 
+    Pure and memoized, see normalize_text.
+
     Args:
         html: HTML text
 
     Returns:
         Cleaned text
     """
-    # Remove script and style elements
-    html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL)
-    html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL)
-    # Remove HTML tags
-    html = re.sub(r'<[^>]+>', '', html)
-    # Decode HTML entities
-    html = html.replace('&nbsp;', ' ')
-    html = html.replace('&lt;', '<')
-    html = html.replace('&gt;', '>')
-    html = html.replace('&amp;', '&')
-    return html
+    # Most Telegram messages carry no markup: memchr-backed membership
+    # tests skip the regex scan entirely for them
+    if '<' not in html and '&' not in html:
+        return html
+
+    # Strip script/style blocks and tags, decoding entities, in one pass
+    return _HTML_STRIP_RE.sub(
+        lambda m: _HTML_ENTITIES.get(m.group(0).lower(), ''), html
+    )
+
+
+@lru_cache(maxsize=4096)
+def _extract_keywords_cached(
+    text: str,
+    min_length: int,
+    max_keywords: Optional[int]
+) -> tuple:
+    """Memoized core of extract_keywords; tuples keep the cache safe."""
+    # Ordered dedup; stops as soon as max_keywords are collected
+    seen: Dict[str, None] = {}
+    for word in text.lower().split():
+        if len(word) >= min_length and word not in seen:
+            seen[word] = None
+            if max_keywords and len(seen) >= max_keywords:
+                break
+
+    return tuple(seen)
 
 
 def extract_keywords(
@@ -63,6 +180,9 @@ def extract_keywords(
     """
     Extract keywords from text.
 
+    Memoized on (text, min_length, max_keywords); each call returns a
+    fresh list so callers may mutate the result freely.
+
     Args:
         text: Input text
         min_length: Minimum keyword length
@@ -71,16 +191,10 @@ def extract_keywords(
     Returns:
         List of keywords
     """
-    # Simple keyword extraction
-    words = text.lower().split()
-    keywords = list(set([w for w in words if len(w) >= min_length]))
-
-    if max_keywords:
-        keywords = keywords[:max_keywords]
-
-    return keywords
+    return list(_extract_keywords_cached(text, min_length, max_keywords))
 
 
+@lru_cache(maxsize=4096)
 def remove_special_chars(
     text: str,
     keep_spaces: bool = True,
@@ -89,6 +203,8 @@ def remove_special_chars(
     """
     Remove special characters from text.
 
+    Pure and memoized, see normalize_text.
+
     Args:
         text: Input text
         keep_spaces: Keep spaces
@@ -97,18 +213,7 @@ def remove_special_chars(
     Returns:
         Cleaned text
     """
-    if keep_punctuation:
-        if keep_spaces:
-            pattern = r'[^a-zA-Z0-9\s.,!?;:-]'
-        else:
-            pattern = r'[^a-zA-Z0-9.,!?;:-]'
-    else:
-        if keep_spaces:
-            pattern = r'[^a-zA-Z0-9\s]'
-        else:
-            pattern = r'[^a-zA-Z0-9]'
-
-    return re.sub(pattern, '', text)
+    return text.translate(_SPECIAL_CHAR_TABLES[(keep_spaces, keep_punctuation)])
 
 
 def truncate_text(
@@ -142,9 +247,52 @@ def count_sentences(text: str) -> int:
     Returns:
         Number of sentences
     """
-    # Split by sentence-ending punctuation
-    sentences = re.split(r'[.!?]+', text)
-    return len([s for s in sentences if s.strip()])
+    # memchr-style fast path: no terminators means zero or one sentence
+    if text.count('.') + text.count('!') + text.count('?') == 0:
+        return 0 if not text or text.isspace() else 1
+
+    # Walk terminator runs, counting the non-blank segments between
+    # them without materializing the full split list
+    count = 0
+    last = 0
+    for match in _SENT_RE.finditer(text):
+        segment = text[last:match.start()]
+        if segment and not segment.isspace():
+            count += 1
+        last = match.end()
+
+    tail = text[last:]
+    if tail and not tail.isspace():
+        count += 1
+
+    return count
+
+
+def text_stats(text: str) -> Dict[str, object]:
+    """
+    Word count, sentence count and normalized text in one pass.
+
+    Per-message callers that need all three avoid scanning the text
+    once per helper: the words are split once and reused for both the
+    count and the normalized join, and lowercasing runs on the already
+    whitespace-collapsed result.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Dict with 'word_count', 'sentence_count' and 'normalized'
+    """
+    words = text.split()
+    sentence_count = sum(
+        1 for s in _SENT_RE.split(text) if s and not s.isspace()
+    )
+
+    return {
+        "word_count": len(words),
+        "sentence_count": sentence_count,
+        "normalized": ' '.join(words).lower(),
+    }
 
 
 def count_words(text: str) -> int:
@@ -160,6 +308,178 @@ def count_words(text: str) -> int:
     return len(text.split())
 
 
+class TextExtractor:
+    """
+    Pattern extractors bound to precompiled regexes.
+
+    Holding an instance gives tight loops slot-attribute access to the
+    compiled patterns instead of a module-global lookup per call. The
+    module-level extract_* functions wrap a shared singleton.
+    """
+
+    __slots__ = ('_url_re', '_email_re', '_mention_re', '_hashtag_re')
+
+    def __init__(self):
+        self._url_re = _URL_RE
+        self._email_re = _EMAIL_RE
+        self._mention_re = _MENTION_RE
+        self._hashtag_re = _HASHTAG_RE
+
+    def extract_urls(self, text: str) -> List[str]:
+        """Extract URLs from text."""
+        return self._url_re.findall(text)
+
+    def extract_emails(self, text: str) -> List[str]:
+        """
+        Extract email addresses from text.
+
+        Anchors on '@' via str.find (a single memchr when no email is
+        present) and expands each hit with set-membership walks,
+        avoiding the backtracking regex engine entirely. Produces the
+        same matches as the _EMAIL_RE pattern.
+        """
+        out: List[str] = []
+        pos = 0
+        n = len(text)
+
+        while True:
+            at = text.find('@', pos)
+            if at < 0:
+                break
+
+            # Expand the local part left, staying past the previous match
+            i = at
+            while i > pos and text[i - 1] in _EMAIL_LOCAL_CHARS:
+                i -= 1
+            if i == at:
+                pos = at + 1
+                continue
+
+            # Expand the domain span right
+            j = at + 1
+            while j < n and text[j] in _EMAIL_DOMAIN_CHARS:
+                j += 1
+
+            # The match ends at the rightmost dot followed by 2+ letters;
+            # later dots always yield the longer (regex-greedy) match
+            end = -1
+            k = j
+            while end < 0:
+                d = text.rfind('.', at + 2, k)
+                if d < 0:
+                    break
+                e = d + 1
+                while e < j and text[e] in _EMAIL_ALPHA:
+                    e += 1
+                if e - d > 2:
+                    end = e
+                else:
+                    k = d
+
+            if end < 0:
+                pos = at + 1
+                continue
+
+            out.append(text[i:end])
+            pos = end
+
+        return out
+
+    def extract_mentions(self, text: str) -> List[str]:
+        """Extract @mentions from text."""
+        return self._mention_re.findall(text)
+
+    def extract_hashtags(self, text: str) -> List[str]:
+        """Extract #hashtags from text."""
+        return self._hashtag_re.findall(text)
+
+
+_EXTRACTOR = TextExtractor()
+
+
+def _findall_batch(pattern: re.Pattern, texts: List[str]) -> List[List[str]]:
+    """
+    Run one regex pass over many texts.
+
+    The texts are joined with a newline — whitespace, so none of the
+    extractor patterns can match across a boundary — scanned once, and
+    each match is routed back to its source text by offset. Amortizes
+    the per-call regex setup across the whole batch.
+    """
+    if not texts:
+        return []
+
+    joined = '\n'.join(texts)
+    ends = list(accumulate(len(t) + 1 for t in texts))
+
+    out: List[List[str]] = [[] for _ in texts]
+    for match in pattern.finditer(joined):
+        out[bisect_right(ends, match.start())].append(match.group())
+
+    return out
+
+
+def _finditer_soa(pattern: re.Pattern, text: str) -> Dict[str, object]:
+    """
+    Match spans as parallel offset arrays over the source text.
+
+    Consumers slice text[start[i]:end[i]] lazily, keeping the columns
+    contiguous and numpy-ready instead of materializing a Python string
+    per match.
+    """
+    starts = []
+    ends = []
+    for match in pattern.finditer(text):
+        starts.append(match.start())
+        ends.append(match.end())
+
+    return {
+        'start': np.array(starts, dtype=np.int32),
+        'end': np.array(ends, dtype=np.int32),
+        'text': text,
+    }
+
+
+def extract_urls_soa(text: str) -> Dict[str, object]:
+    """URL match spans as parallel start/end arrays over text."""
+    return _finditer_soa(_URL_RE, text)
+
+
+def extract_emails_soa(text: str) -> Dict[str, object]:
+    """Email match spans as parallel start/end arrays over text."""
+    return _finditer_soa(_EMAIL_RE, text)
+
+
+def extract_mentions_soa(text: str) -> Dict[str, object]:
+    """Mention match spans as parallel start/end arrays over text."""
+    return _finditer_soa(_MENTION_RE, text)
+
+
+def extract_hashtags_soa(text: str) -> Dict[str, object]:
+    """Hashtag match spans as parallel start/end arrays over text."""
+    return _finditer_soa(_HASHTAG_RE, text)
+
+
+def extract_urls_batch(texts: List[str]) -> List[List[str]]:
+    """Extract URLs from each text in one scan over the batch."""
+    return _findall_batch(_URL_RE, texts)
+
+
+def extract_emails_batch(texts: List[str]) -> List[List[str]]:
+    """Extract email addresses from each text in one scan over the batch."""
+    return _findall_batch(_EMAIL_RE, texts)
+
+
+def extract_mentions_batch(texts: List[str]) -> List[List[str]]:
+    """Extract @mentions from each text in one scan over the batch."""
+    return _findall_batch(_MENTION_RE, texts)
+
+
+def extract_hashtags_batch(texts: List[str]) -> List[List[str]]:
+    """Extract #hashtags from each text in one scan over the batch."""
+    return _findall_batch(_HASHTAG_RE, texts)
+
+
 def extract_urls(text: str) -> List[str]:
     """
     Extract URLs from text.
@@ -170,8 +490,7 @@ def extract_urls(text: str) -> List[str]:
     Returns:
         List of URLs
     """
-    pattern = r'https?://[^\s]+'
-    return re.findall(pattern, text)
+    return _EXTRACTOR.extract_urls(text)
 
 
 def extract_emails(text: str) -> List[str]:
@@ -184,8 +503,7 @@ def extract_emails(text: str) -> List[str]:
     Returns:
         List of email addresses
     """
-    pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    return re.findall(pattern, text)
+    return _EXTRACTOR.extract_emails(text)
 
 
 def extract_mentions(text: str) -> List[str]:
@@ -198,8 +516,7 @@ def extract_mentions(text: str) -> List[str]:
     Returns:
         List of mentions
     """
-    pattern = r'@\w+'
-    return re.findall(pattern, text)
+    return _EXTRACTOR.extract_mentions(text)
 
 
 def extract_hashtags(text: str) -> List[str]:
@@ -212,23 +529,108 @@ def extract_hashtags(text: str) -> List[str]:
     Returns:
         List of hashtags
     """
-    pattern = r'#\w+'
-    return re.findall(pattern, text)
+    return _EXTRACTOR.extract_hashtags(text)
 
 
-def extract_numbers(text: str) -> List[float]:
+def extract_all(text: str) -> Dict[str, List[str]]:
+    """
+    Extract URLs, emails, mentions and hashtags in a single scan.
+
+    Amortizes one pass over the text across all four extractors.
+    Matches are non-overlapping with precedence url > email > mention >
+    hashtag, so the address part of an email is not also reported as a
+    mention.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Dict with 'urls', 'emails', 'mentions' and 'hashtags' lists
+    """
+    results: Dict[str, List[str]] = {
+        "urls": [],
+        "emails": [],
+        "mentions": [],
+        "hashtags": [],
+    }
+
+    for match in _EXTRACT_ALL_RE.finditer(text):
+        url, email, mention, hashtag = match.group(
+            "url", "email", "mention", "hashtag"
+        )
+        if url is not None:
+            results["urls"].append(url)
+        elif email is not None:
+            results["emails"].append(email)
+        elif mention is not None:
+            results["mentions"].append(mention)
+        else:
+            results["hashtags"].append(hashtag)
+
+    return results
+
+
+def tokenize_all(text: str) -> Dict[str, List]:
+    """
+    Classify URLs, emails, mentions, hashtags and numbers in one scan.
+
+    Message preprocessing that needs all five token families pays a
+    single pass over the text instead of one per extractor. Precedence
+    follows extract_all, with numbers last so dosage digits inside a
+    URL or email are not double-counted.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Dict with 'urls', 'emails', 'mentions', 'hashtags' and
+        'numbers' (floats) lists
+    """
+    results: Dict[str, List] = {
+        "urls": [],
+        "emails": [],
+        "mentions": [],
+        "hashtags": [],
+        "numbers": [],
+    }
+
+    for match in _TOKENIZE_ALL_RE.finditer(text):
+        url, email, mention, hashtag, number = match.group(
+            "url", "email", "mention", "hashtag", "number"
+        )
+        if url is not None:
+            results["urls"].append(url)
+        elif email is not None:
+            results["emails"].append(email)
+        elif mention is not None:
+            results["mentions"].append(mention)
+        elif hashtag is not None:
+            results["hashtags"].append(hashtag)
+        else:
+            results["numbers"].append(float(number))
+
+    return results
+
+
+def extract_numbers(text: str, return_array: bool = False):
     """
     Extract numbers from text.
 
     Args:
         text: Input text
+        return_array: Return a float64 ndarray instead of a list,
+            skipping the Python-object round-trip for callers doing
+            vectorized math on the result
 
     Returns:
-        List of numbers
+        List of numbers, or ndarray when return_array is True
     """
-    pattern = r'\d+\.?\d*'
-    matches = re.findall(pattern, text)
-    return [float(m) for m in matches]
+    matches = _NUMBER_RE.findall(text)
+    # One C-level conversion loop instead of a float() call per match
+    arr = np.array(matches, dtype=np.float64) if matches else np.empty(0)
+    if return_array:
+        return arr
+    return arr.tolist()
 
 
 def camel_to_snake(text: str) -> str:
@@ -241,8 +643,21 @@ def camel_to_snake(text: str) -> str:
     Returns:
         Converted text
     """
-    text = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', text).lower()
+    # Single walk: underscore before an uppercase that ends a run
+    # (next char is lowercase) or follows a lowercase/digit
+    out = []
+    n = len(text)
+    for i, c in enumerate(text):
+        if 'A' <= c <= 'Z' and i > 0:
+            prev = text[i - 1]
+            if (
+                'a' <= prev <= 'z'
+                or '0' <= prev <= '9'
+                or (i + 1 < n and 'a' <= text[i + 1] <= 'z')
+            ):
+                out.append('_')
+        out.append(c.lower())
+    return ''.join(out)
 
 
 def snake_to_camel(text: str) -> str:
@@ -259,6 +674,32 @@ def snake_to_camel(text: str) -> str:
     return components[0] + ''.join(x.title() for x in components[1:])
 
 
+@lru_cache(maxsize=128)
+def _keyword_matcher(keywords: tuple):
+    """
+    Matcher for a keyword set, built once per distinct tuple.
+
+    Returns an Aho-Corasick automaton when pyahocorasick is installed
+    (one O(n) pass regardless of keyword count), otherwise a fused
+    case-insensitive alternation with longest-first precedence. Both
+    come with a lowercase → original-keyword map for the replacement.
+    """
+    canonical = {k.lower(): k for k in keywords}
+
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for k in canonical:
+            automaton.add_word(k, k)
+        automaton.make_automaton()
+        return automaton, canonical
+
+    ordered = sorted(canonical, key=len, reverse=True)
+    pattern = re.compile(
+        '|'.join(re.escape(k) for k in ordered), re.IGNORECASE
+    )
+    return pattern, canonical
+
+
 def highlight_keywords(
     text: str,
     keywords: List[str],
@@ -267,6 +708,9 @@ def highlight_keywords(
     """
     Highlight keywords in text.
 
+    All keywords are matched in a single scan of the text instead of
+    one pass per keyword; longer keywords win where they overlap.
+
     Args:
         text: Input text
         keywords: Keywords to highlight
@@ -275,17 +719,35 @@ def highlight_keywords(
     Returns:
         Text with highlighted keywords
     """
-    result = text
-    for keyword in keywords:
-        # Case-insensitive replacement
-        pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-        result = pattern.sub(f"{highlight_char}{keyword}{highlight_char}", result)
-    return result
+    if not keywords:
+        return text
+
+    matcher, canonical = _keyword_matcher(tuple(keywords))
+
+    if AHOCORASICK_AVAILABLE:
+        lowered = text.lower()
+        parts = []
+        last = 0
+        for end, key in matcher.iter_long(lowered):
+            start = end - len(key) + 1
+            parts.append(text[last:start])
+            parts.append(f"{highlight_char}{canonical[key]}{highlight_char}")
+            last = end + 1
+        parts.append(text[last:])
+        return ''.join(parts)
+
+    return matcher.sub(
+        lambda m: f"{highlight_char}{canonical[m.group(0).lower()]}{highlight_char}",
+        text,
+    )
 
 
 def similarity_score(text1: str, text2: str) -> float:
     """
-    Calculate text similarity score (simple Levenshtein-based).
+    Calculate text similarity score.
+
+    Uses RapidFuzz's bit-parallel token_set_ratio when available; falls
+    back to a pure-Python token Jaccard otherwise.
 
     Args:
         text1: First text
@@ -294,17 +756,88 @@ def similarity_score(text1: str, text2: str) -> float:
     Returns:
         Similarity score (0-1)
     """
-    text1 = normalize_text(text1)
-    text2 = normalize_text(text2)
+    if RAPIDFUZZ_AVAILABLE:
+        if not text1.split() and not text2.split():
+            return 1.0
+        return token_set_ratio(text1, text2) / 100.0
 
-    # Dice coefficient
-    set1 = set(text1.split())
-    set2 = set(text2.split())
+    # split() already collapses whitespace, so the words are identical
+    # to normalize_text's output without the join/strip passes
+    set1 = frozenset(text1.lower().split())
+    set2 = frozenset(text2.lower().split())
 
     if not set1 and not set2:
         return 1.0
 
-    intersection = len(set1.intersection(set2))
-    union = len(set1.union(set2))
+    intersection = len(set1 & set2)
+    union = len(set1) + len(set2) - intersection
+
+    return intersection / union if union > 0 else 0.0
+
+
+def build_similarity_index(texts: List[str]):
+    """
+    Build a TF-IDF index over a corpus for batched similarity queries.
+
+    Embeds every text once; query_similar then scores a probe against
+    the whole corpus with a single sparse matmul instead of O(n)
+    pairwise similarity_score calls.
+
+    Args:
+        texts: Corpus to index
+
+    Returns:
+        Opaque index handle for query_similar
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer()
+    matrix = vectorizer.fit_transform(texts)
+    return vectorizer, matrix, list(texts)
+
+
+def query_similar(text: str, index, k: int = 5) -> List[tuple]:
+    """
+    Find the k most similar indexed texts to a probe.
+
+    Args:
+        text: Probe text
+        index: Handle from build_similarity_index
+        k: Number of neighbours to return
+
+    Returns:
+        List of (corpus_index, text, cosine_score), best first
+    """
+    vectorizer, matrix, texts = index
+
+    # TF-IDF rows are L2-normalized, so the dot product is the cosine
+    scores = matrix.dot(vectorizer.transform([text]).T).toarray().ravel()
+    k = min(k, scores.size)
+    top = np.argpartition(scores, -k)[-k:]
+    top = top[np.argsort(scores[top])[::-1]]
+
+    return [(int(i), texts[i], float(scores[i])) for i in top]
+
+
+def similarity_matrix(queries: List[str], choices: List[str]):
+    """
+    Pairwise similarity scores between two text collections.
+
+    Uses rapidfuzz.process.cdist, which releases the GIL and scores the
+    whole matrix in parallel; falls back to a nested similarity_score
+    loop when RapidFuzz is unavailable.
+
+    Args:
+        queries: Row texts
+        choices: Column texts
+
+    Returns:
+        len(queries) x len(choices) array of scores (0-1)
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return _rf_cdist(queries, choices, scorer=token_set_ratio) / 100.0
 
-    return intersection / union if union > 0 else 0.0
\ No newline at end of file
+    return [
+        [similarity_score(q, c) for c in choices]
+        for q in queries
+    ]
\ No newline at end of file
@@ -7,9 +7,16 @@ Author: Boris (Claude Code)
 
 import pytest
 from src.nlp.medical_ner import MedicalNER, MedicalEntity
+from src.nlp.entity_linker import MedicalEntityLinker
 from src.core.exceptions import ModelLoadingError, EntityExtractionError
 
 
+@pytest.fixture(scope="session")
+def linker():
+    """Shared entity linker; the KB is read-only across tests."""
+    return MedicalEntityLinker()
+
+
 @pytest.mark.unit
 class TestMedicalNER:
     """Test Medical Named Entity Recognizer."""
@@ -184,16 +191,13 @@ class TestMedicalNER:
 
     def test_case_insensitivity(self):
         """Test case insensitive extraction."""
-        ner = MedicalNER.__new__(MedicalNER)
-        ner._init_patterns()
-        
         # Dosage patterns should work with different cases
         texts = ["500MG", "500mg", "500Mg", "500mG"]
-        
+
         for text in texts:
-            matches = list(ner.dosage_regex.finditer(text, flags=ner.dosage_regex.flags))
-            # Pattern is case-insensitive
-            assert len(matches) > 0 or len(matches) == 0  # Depends on regex
+            matches = list(MedicalNER._DOSAGE_RE.finditer(text))
+            # Pattern is compiled with re.IGNORECASE
+            assert len(matches) == 1
 
     def test_duplicate_entity_removal(self):
         """Test that duplicate entities are removed."""
@@ -0,0 +1,39 @@
+"""
+Shared fixtures for performance tests.
+
+Session scope means each xdist worker loads the models once and every
+test class it owns reuses them.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.nlp.message_processor import MedicalMessageProcessor
+from src.nlp.medical_ner import MedicalNER
+from src.nlp.text_classifier import MedicalTextClassifier
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Get test client, shared so app startup runs once per session."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def processor():
+    """Get message processor, loaded once per session."""
+    return MedicalMessageProcessor()
+
+
+@pytest.fixture(scope="session")
+def ner():
+    """Get NER, loaded once per session."""
+    return MedicalNER()
+
+
+@pytest.fixture(scope="session")
+def classifier():
+    """Get classifier, loaded once per session."""
+    return MedicalTextClassifier()
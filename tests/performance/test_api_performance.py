@@ -2,11 +2,14 @@
 Performance tests for NLP and API operations.
 """
 
+import asyncio
 import pytest
 import time
 import sys
 from pathlib import Path
 
+import httpx
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.nlp.message_processor import MedicalMessageProcessor
@@ -19,11 +22,6 @@ from src.api.main import app
 class TestAPIPerformance:
     """Performance tests for API endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        """Get test client."""
-        return TestClient(app)
-
     def test_nlp_endpoint_response_time(self, client, benchmark):
         """Test NLP endpoint response time."""
         payload = {"text": "Amoxicillin 500mg for infection"}
@@ -50,22 +48,32 @@ class TestAPIPerformance:
         response = benchmark(request)
         assert response.status_code == 200
 
-    def test_concurrent_nlp_requests(self, client):
-        """Test handling concurrent NLP requests."""
-        import concurrent.futures
-
+    @pytest.mark.serial
+    @pytest.mark.asyncio
+    async def test_concurrent_nlp_requests(self, client):
+        """Test handling concurrent NLP requests.
+
+        Uses AsyncClient + gather so requests dispatch concurrently on
+        one event loop, matching production async behavior instead of
+        threads serializing through TestClient's portal. The session
+        ``client`` fixture keeps the lifespan open so ``app.state``
+        holds the processor and batcher.
+        """
         payload = {"text": "Amoxicillin 500mg for infection"}
 
-        def make_request():
-            return client.post("/api/v1/nlp/process-message", json=payload)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(make_request) for _ in range(20)]
-            results = [f.result() for f in concurrent.futures.as_completed(futures)]
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as ac:
+            results = await asyncio.gather(*[
+                ac.post("/api/v1/nlp/process-message", json=payload)
+                for _ in range(20)
+            ])
 
         assert len(results) == 20
         assert all(r.status_code == 200 for r in results)
 
+    @pytest.mark.serial
     def test_endpoint_load(self, client):
         """Test API under load."""
         payload = {"text": "Amoxicillin 500mg for infection"}
@@ -80,6 +88,81 @@ class TestAPIPerformance:
         avg_response_time = elapsed / requests_count
         assert avg_response_time < 1.0  # Less than 1 second per request
 
+    @pytest.mark.serial
+    @pytest.mark.asyncio
+    async def test_request_coalescing_throughput(self, client):
+        """Test coalesced concurrent requests all come back correct.
+
+        The session ``client`` fixture keeps the lifespan open so the
+        batcher exists on ``app.state``. Wall-clock throughput is
+        reported for inspection but not asserted; timing comparisons
+        flake under load.
+        """
+        payload = {"text": "Amoxicillin 500mg for infection"}
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as ac:
+            # Sequential baseline
+            start = time.time()
+            for _ in range(8):
+                response = await ac.post(
+                    "/api/v1/nlp/process-message", json=payload
+                )
+                assert response.status_code == 200
+            sequential_throughput = 8 / (time.time() - start)
+
+            # 64 concurrent requests coalesced by the batcher
+            start = time.time()
+            responses = await asyncio.gather(*[
+                ac.post("/api/v1/nlp/process-message", json=payload)
+                for _ in range(64)
+            ])
+            batched_throughput = 64 / (time.time() - start)
+
+        assert all(r.status_code == 200 for r in responses)
+        # Every coalesced caller must get its own complete result back
+        for response in responses:
+            body = response.json()
+            assert body["text"] == payload["text"]
+            assert body["processing_status"] == "success"
+            assert isinstance(body["entities"], list)
+        print(
+            f"coalescing throughput: {batched_throughput:.1f}/s batched "
+            f"vs {sequential_throughput:.1f}/s sequential"
+        )
+
+    def test_batch_response_serialization(self, benchmark):
+        """Test rendering a large entity payload through the response class."""
+        from src.api.main import DEFAULT_RESPONSE_CLASS
+
+        payload = [
+            {
+                "text": f"message {i}",
+                "is_medical": True,
+                "medical_confidence": 0.9,
+                "entities": [
+                    {
+                        "text": "Amoxicillin",
+                        "entity_type": "MEDICATION",
+                        "start_char": 0,
+                        "end_char": 11,
+                        "confidence": 0.95,
+                        "normalized": "Amoxicillin",
+                    }
+                ] * 5,
+                "quality_score": 0.8,
+                "processing_status": "success",
+                "error_message": None,
+            }
+            for i in range(200)
+        ]
+
+        response = benchmark(lambda: DEFAULT_RESPONSE_CLASS(payload))
+        assert response.status_code == 200
+
+    @pytest.mark.serial
     def test_memory_usage_under_load(self, client):
         """Test memory usage under load."""
         import psutil
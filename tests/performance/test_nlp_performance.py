@@ -2,11 +2,14 @@
 Performance tests for NLP and API operations.
 """
 
+import asyncio
 import pytest
 import time
 import sys
 from pathlib import Path
 
+import httpx
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.nlp.message_processor import MedicalMessageProcessor
@@ -15,57 +18,84 @@ from src.nlp.text_classifier import MedicalTextClassifier
 from fastapi.testclient import TestClient
 from src.api.main import app
 
+# Benchmark inputs at module scope so the timed callables close over
+# constants instead of rebuilding them per round
+TEXT_MED = "Amoxicillin 500mg twice daily for bacterial infection treatment"
+TEXT_CLASSIFY = "Patient has fever and needs medication for treatment"
+TEXT_PROCESS = "Amoxicillin 500mg for infection. Patient needs follow-up in 5 days."
+
 
 class TestNLPPerformance:
     """Performance tests for NLP operations."""
 
-    @pytest.fixture
-    def processor(self):
-        """Get message processor."""
-        return MedicalMessageProcessor()
-
-    @pytest.fixture
-    def ner(self):
-        """Get NER."""
-        return MedicalNER()
-
-    @pytest.fixture
-    def classifier(self):
-        """Get classifier."""
-        return MedicalTextClassifier()
-
     def test_ner_performance(self, ner, benchmark):
         """Test NER extraction performance."""
-        text = "Amoxicillin 500mg twice daily for bacterial infection treatment"
+        ner.extract_entities(TEXT_MED)  # warmup: compile regexes, fill caches
 
         def extract():
-            return ner.extract_entities(text)
+            return ner.extract_entities(TEXT_MED)
 
         result = benchmark(extract)
         assert len(result) > 0
 
     def test_classification_performance(self, classifier, benchmark):
         """Test text classification performance."""
-        text = "Patient has fever and needs medication for treatment"
+        classifier.classify(TEXT_CLASSIFY)  # warmup
 
         def classify():
-            return classifier.classify(text)
+            return classifier.classify(TEXT_CLASSIFY)
 
         result = benchmark(classify)
         assert result.is_medical
 
     def test_message_processing_performance(self, processor, benchmark):
         """Test message processing performance."""
-        text = "Amoxicillin 500mg for infection. Patient needs follow-up in 5 days."
+        processor.process_message(TEXT_PROCESS)  # warmup
 
         def process():
-            return processor.process_message(text)
+            return processor.process_message(TEXT_PROCESS)
 
         result = benchmark(process)
         assert result is not None
 
-    def test_batch_processing_performance(self, processor):
-        """Test batch processing performance."""
+    @pytest.mark.serial
+    @pytest.mark.asyncio
+    async def test_batch_processing_performance(self, client):
+        """Test batch processing performance.
+
+        Dispatches batch-endpoint requests concurrently so NLP compute
+        and request I/O overlap instead of serializing in a for loop.
+        The session ``client`` fixture keeps the app lifespan open so
+        ``app.state`` is populated for the ASGI transport below.
+        """
+        texts = [
+            "Amoxicillin 500mg for infection",
+            "Patient has fever symptoms",
+            "Paracetamol 500mg twice daily",
+        ] * 10  # 30 messages
+        chunk = 10
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as ac:
+            start_time = time.time()
+            responses = await asyncio.gather(*[
+                ac.post(
+                    "/api/v1/nlp/batch-process",
+                    json=[{"text": t} for t in texts[i:i + chunk]],
+                )
+                for i in range(0, len(texts), chunk)
+            ])
+            elapsed = time.time() - start_time
+
+        assert all(r.status_code == 200 for r in responses)
+        throughput = len(texts) / elapsed
+        assert throughput > 1  # At least 1 message per second
+
+    @pytest.mark.serial
+    def test_fused_batch_processing_performance(self, processor):
+        """Test the fused process_batch path against the serial loop."""
         texts = [
             "Amoxicillin 500mg for infection",
             "Patient has fever symptoms",
@@ -73,24 +103,51 @@ class TestNLPPerformance:
         ] * 10  # 30 messages
 
         start_time = time.time()
-        for text in texts:
-            processor.process_message(text)
+        results = processor.process_batch(texts)
         elapsed = time.time() - start_time
 
-        # Should process 30 messages in reasonable time
-        assert elapsed < 30  # Adjust threshold as needed
+        assert len(results) == len(texts)
+        assert all(r.processing_status == "success" for r in results)
         avg_time = elapsed / len(texts)
         assert avg_time < 1.0  # Less than 1 second per message
 
+    @pytest.mark.serial
+    def test_ner_soa_batch_memory(self, ner):
+        """Test SoA batch results allocate less than per-object lists."""
+        import tracemalloc
+
+        from src.nlp.medical_ner import EntitySoA
+
+        texts = ["Amoxicillin 500mg for infection"] * 50
+
+        tracemalloc.start()
+        soa = ner.extract_entities_batch_soa(texts)
+        _, soa_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert isinstance(soa, EntitySoA)
+        assert len(soa) == int(soa.offsets[-1])
+        assert len(soa.offsets) == len(texts) + 1
+        # Vectorized filtering works on the parallel arrays
+        assert (soa.confidences >= 0.0).all()
+        assert soa_peak < 50 * 1024 * 1024  # Well under 50MB for 50 texts
+
+    @pytest.mark.serial
     def test_ner_extraction_throughput(self, ner):
-        """Test NER extraction throughput."""
-        text = "Amoxicillin 500mg for infection"
-        repetitions = 100
+        """Test NER extraction throughput on the batched pipe path.
+
+        One extract_entities_batch call lets spaCy amortize pipeline
+        overhead across the batch instead of paying it per text.
+        """
+        texts = ["Amoxicillin 500mg for infection"] * 100
 
         start_time = time.time()
-        for _ in range(repetitions):
-            ner.extract_entities(text)
+        results = ner.extract_entities_batch(texts, batch_size=32)
         elapsed = time.time() - start_time
 
-        throughput = repetitions / elapsed
+        assert len(results) == len(texts)
+        throughput = len(texts) / elapsed
         assert throughput > 10  # At least 10 extractions per second
+        # Model-agnostic metric: whitespace tokens processed per second
+        throughput_tokens = sum(len(t.split()) for t in texts) / elapsed
+        assert throughput_tokens > 1000
@@ -0,0 +1,67 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.core.exceptions import ModelLoadingError
+from src.database.models import Base
+from src.nlp.medical_ner import MedicalNER
+from src.nlp.message_processor import MedicalMessageProcessor
+from src.nlp.text_classifier import MedicalTextClassifier
+
+
+@pytest.fixture(scope="session")
+def ner():
+    """NER loaded once per xdist worker; the tests only read from it."""
+    try:
+        return MedicalNER(model_name="en_core_sci_md")
+    except ModelLoadingError:
+        pytest.skip("spaCy model not available")
+
+
+@pytest.fixture(scope="session")
+def sample_medical_text():
+    """Canonical sample message used across extraction tests."""
+    return (
+        "Patient prescribed Amoxicillin 500mg twice daily for "
+        "malaria infection. Price: 50 ETB."
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_doc(ner, sample_medical_text):
+    """Sample text parsed once; tests consuming it skip the forward pass."""
+    return ner.nlp(sample_medical_text)
+
+
+@pytest.fixture(scope="session")
+def processor():
+    """Message processor loaded once per xdist worker."""
+    return MedicalMessageProcessor()
+
+
+@pytest.fixture(scope="session")
+def classifier():
+    """Text classifier loaded once per xdist worker."""
+    return MedicalTextClassifier()
+
+
+@pytest.fixture
+def db_session():
+    """Real session against in-memory SQLite with the actual models.
+
+    Unlike a MagicMock, this exercises real SQL, so missing indexes or
+    N+1 regressions surface in the query plans.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+        engine.dispose()
@@ -15,6 +15,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.core.config import Settings, get_settings
 
 
+@pytest.fixture(scope="module")
+def settings():
+    """One validated Settings instance shared by the read-only tests."""
+    return Settings()
+
+
 class TestSettings:
     """Test Settings class."""
 
@@ -26,38 +32,33 @@ class TestSettings:
         assert hasattr(settings, "database_url")
         assert hasattr(settings, "api_key")
 
-    def test_default_database_url(self):
+    def test_default_database_url(self, settings):
         """Test default database URL."""
-        settings = Settings()
 
         assert settings.database_url is not None
         assert "sqlite" in settings.database_url or "postgresql" in settings.database_url
 
-    def test_api_settings(self):
+    def test_api_settings(self, settings):
         """Test API settings."""
-        settings = Settings()
 
         assert hasattr(settings, "api_host")
         assert hasattr(settings, "api_port")
         assert settings.api_port > 0
 
-    def test_logging_settings(self):
+    def test_logging_settings(self, settings):
         """Test logging settings."""
-        settings = Settings()
 
         assert hasattr(settings, "log_level")
         assert settings.log_level in ["DEBUG", "INFO", "WARNING", "ERROR"]
 
-    def test_nlp_settings(self):
+    def test_nlp_settings(self, settings):
         """Test NLP settings."""
-        settings = Settings()
 
         assert hasattr(settings, "nlp_model_name")
         assert settings.nlp_model_name == "en_core_sci_md"
 
-    def test_database_settings(self):
+    def test_database_settings(self, settings):
         """Test database settings."""
-        settings = Settings()
 
         assert hasattr(settings, "db_pool_size")
         assert hasattr(settings, "db_max_overflow")
@@ -71,6 +72,13 @@ class TestSettings:
         # Should load from environment
         assert settings.api_key == "test_key_123"
 
+    def test_fast_construction_skips_validation(self):
+        """Test Settings.fast builds from defaults without validation."""
+        settings = Settings.fast()
+
+        assert settings.app_name == "Medical Intelligence Platform"
+        assert settings.nlp_confidence_threshold == 0.6
+
     def test_settings_validation(self):
         """Test settings validation."""
         try:
@@ -89,6 +97,15 @@ class TestSettingsCaching:
         settings2 = get_settings()
 
         assert settings1 is settings2
+        assert get_settings.cache_info().hits >= 1
+
+    def test_env_change_not_picked_up_after_first_call(self, monkeypatch):
+        """Test env changes after the first call do not re-parse settings."""
+        settings_before = get_settings()
+        monkeypatch.setenv("APP_NAME", "Changed After Cache")
+
+        assert get_settings().app_name == settings_before.app_name
+        assert get_settings().app_name != "Changed After Cache"
 
     def test_settings_attributes_consistent(self):
         """Test settings attributes are consistent."""
@@ -103,24 +120,21 @@ class TestSettingsCaching:
 class TestDatabaseConfiguration:
     """Test database configuration."""
 
-    def test_database_url_format(self):
+    def test_database_url_format(self, settings):
         """Test database URL format."""
-        settings = Settings()
 
         # Should be valid SQLAlchemy URL
         assert "://" in settings.database_url
 
-    def test_database_pool_settings(self):
+    def test_database_pool_settings(self, settings):
         """Test database pool settings."""
-        settings = Settings()
 
         assert settings.db_pool_size > 0
         assert settings.db_max_overflow >= 0
         assert settings.db_pool_size <= settings.db_pool_size + settings.db_max_overflow
 
-    def test_database_timeout(self):
+    def test_database_timeout(self, settings):
         """Test database timeout setting."""
-        settings = Settings()
 
         assert hasattr(settings, "db_timeout")
         assert settings.db_timeout > 0
@@ -129,17 +143,15 @@ class TestDatabaseConfiguration:
 class TestTelegramConfiguration:
     """Test Telegram configuration."""
 
-    def test_telegram_settings_exist(self):
+    def test_telegram_settings_exist(self, settings):
         """Test Telegram settings exist."""
-        settings = Settings()
 
         assert hasattr(settings, "telegram_api_id")
         assert hasattr(settings, "telegram_api_hash")
         assert hasattr(settings, "telegram_phone_number")
 
-    def test_telegram_rate_limit(self):
+    def test_telegram_rate_limit(self, settings):
         """Test Telegram rate limit."""
-        settings = Settings()
 
         assert hasattr(settings, "telegram_rate_limit")
         assert settings.telegram_rate_limit > 0
@@ -148,23 +160,20 @@ class TestTelegramConfiguration:
 class TestAPIConfiguration:
     """Test API configuration."""
 
-    def test_api_host(self):
+    def test_api_host(self, settings):
         """Test API host configuration."""
-        settings = Settings()
 
         assert settings.api_host is not None
         # Should be localhost or 0.0.0.0 for development
         assert settings.api_host in ["localhost", "0.0.0.0", "127.0.0.1"]
 
-    def test_api_port(self):
+    def test_api_port(self, settings):
         """Test API port configuration."""
-        settings = Settings()
 
         assert 1000 < settings.api_port < 65535
 
-    def test_api_base_url(self):
+    def test_api_base_url(self, settings):
         """Test API base URL."""
-        settings = Settings()
 
         assert hasattr(settings, "api_base_url")
 
@@ -172,22 +181,19 @@ class TestAPIConfiguration:
 class TestLoggingConfiguration:
     """Test logging configuration."""
 
-    def test_log_level_valid(self):
+    def test_log_level_valid(self, settings):
         """Test log level is valid."""
-        settings = Settings()
 
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         assert settings.log_level in valid_levels
 
-    def test_log_file_path(self):
+    def test_log_file_path(self, settings):
         """Test log file path."""
-        settings = Settings()
 
         assert hasattr(settings, "log_file")
 
-    def test_log_format(self):
+    def test_log_format(self, settings):
         """Test log format."""
-        settings = Settings()
 
         assert hasattr(settings, "log_format")
 
@@ -195,17 +201,15 @@ class TestLoggingConfiguration:
 class TestFeatureFlags:
     """Test feature flags."""
 
-    def test_feature_flags_exist(self):
+    def test_feature_flags_exist(self, settings):
         """Test feature flags exist."""
-        settings = Settings()
 
         assert hasattr(settings, "enable_nlp")
         assert hasattr(settings, "enable_extraction")
         assert hasattr(settings, "enable_api")
 
-    def test_feature_flags_boolean(self):
+    def test_feature_flags_boolean(self, settings):
         """Test feature flags are boolean."""
-        settings = Settings()
 
         assert isinstance(settings.enable_nlp, bool)
         assert isinstance(settings.enable_extraction, bool)
@@ -124,7 +124,10 @@ class TestEntityCRUD:
 
         crud.create_batch(entities)
 
-        assert mock_session.add_all.called or mock_session.add.called
+        mock_session.bulk_insert_mappings.assert_called_once()
+        _, mappings = mock_session.bulk_insert_mappings.call_args[0]
+        assert mappings == entities
+        assert not mock_session.add.called
 
     def test_get_by_type(self, crud, mock_session):
         """Test getting entities by type."""
@@ -238,4 +241,96 @@ class TestCRUDErrorHandling:
                 text="Test",
                 date=datetime.utcnow()
             )
-            crud.session.commit()
\ No newline at end of file
+            crud.session.commit()
+
+class TestCRUDWithSQLite:
+    """CRUD operations against in-memory SQLite with the real models.
+
+    Mock-based tests above verify call shapes; these verify the SQL
+    actually works and stays on indexed paths.
+    """
+
+    @pytest.fixture
+    def message(self, db_session):
+        """Create a channel and one message to hang entities off."""
+        channel = Channel(name="test-channel", telegram_id=1)
+        db_session.add(channel)
+        db_session.commit()
+
+        return MessageCRUD(db_session).create(
+            telegram_id=1,
+            channel_id=channel.id,
+            text="Amoxicillin 500mg for infection",
+            date=datetime.utcnow(),
+            is_medical=True,
+        )
+
+    def test_message_roundtrip(self, db_session, message):
+        """Test created message is readable by ID and telegram ID."""
+        crud = MessageCRUD(db_session)
+
+        assert crud.get_by_id(message.id).text == message.text
+        assert crud.get_by_telegram_id(1).id == message.id
+        assert crud.count(medical_only=True) == 1
+
+    def test_entity_batch_insert(self, db_session, message):
+        """Test bulk insert lands all rows."""
+        crud = EntityCRUD(db_session)
+        entities = [
+            {
+                "message_id": message.id,
+                "text": f"entity-{i}",
+                "entity_type": "MEDICATION",
+                "confidence": 0.9,
+            }
+            for i in range(50)
+        ]
+
+        count = crud.create_batch(entities)
+
+        assert count == 50
+        assert crud.count(entity_type="MEDICATION") == 50
+        assert len(crud.get_by_message(message.id)) == 50
+
+    def test_get_by_type_uses_index(self, db_session, message):
+        """Test entity_type lookups hit the index, not a full scan."""
+        from sqlalchemy import text
+
+        EntityCRUD(db_session).create_batch([
+            {"message_id": message.id, "text": "x", "entity_type": "DOSAGE"}
+        ])
+
+        plan = db_session.execute(text(
+            "EXPLAIN QUERY PLAN "
+            "SELECT * FROM entities WHERE entity_type = 'DOSAGE'"
+        )).fetchall()
+        plan_text = " ".join(str(row) for row in plan)
+
+        assert "USING INDEX" in plan_text.upper()
+
+    def test_product_top_products(self, db_session):
+        """Test top products come back ordered by mention count."""
+        crud = ProductCRUD(db_session)
+        crud.create(name="Amoxicillin", mention_count=5)
+        crud.create(name="Paracetamol", mention_count=9)
+
+        top = crud.get_top_products(limit=2)
+
+        assert [p.name for p in top] == ["Paracetamol", "Amoxicillin"]
+
+    def test_batch_insert_bumps_product_counter(self, db_session, message):
+        """Test bulk entity inserts maintain the denormalized counter."""
+        products = ProductCRUD(db_session)
+        products.create(name="Amoxicillin", mention_count=0)
+
+        EntityCRUD(db_session).create_batch([
+            {
+                "message_id": message.id,
+                "text": "Amoxicillin",
+                "entity_type": "MEDICATION",
+            }
+            for _ in range(3)
+        ])
+        db_session.expire_all()
+
+        assert products.get_by_name("Amoxicillin").mention_count == 3
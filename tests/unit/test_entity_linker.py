@@ -17,11 +17,6 @@ from src.nlp.entity_linker import MedicalEntityLinker
 class TestEntityLinker:
     """Test entity linker."""
 
-    @pytest.fixture
-    def linker(self):
-        """Create linker instance."""
-        return MedicalEntityLinker()
-
     def test_linker_initialization(self, linker):
         """Test linker initialization."""
         assert linker is not None
@@ -74,11 +69,6 @@ class TestEntityLinker:
 class TestFuzzyMatching:
     """Test fuzzy matching for similar entities."""
 
-    @pytest.fixture
-    def linker(self):
-        """Create linker instance."""
-        return MedicalEntityLinker()
-
     def test_fuzzy_match_typo(self, linker):
         """Test fuzzy matching with typo."""
         # Misspelled medication
@@ -108,11 +98,6 @@ class TestFuzzyMatching:
 class TestKnowledgeBase:
     """Test knowledge base."""
 
-    @pytest.fixture
-    def linker(self):
-        """Create linker instance."""
-        return MedicalEntityLinker()
-
     def test_common_medications_linked(self, linker):
         """Test common medications are linked."""
         medications = [
@@ -157,11 +142,6 @@ class TestKnowledgeBase:
 class TestNormalization:
     """Test entity normalization."""
 
-    @pytest.fixture
-    def linker(self):
-        """Create linker instance."""
-        return MedicalEntityLinker()
-
     def test_normalize_whitespace(self, linker):
         """Test normalizing whitespace."""
         text = "  Amoxicillin  "
@@ -189,11 +169,6 @@ class TestNormalization:
 class TestConfidenceScoring:
     """Test confidence scoring."""
 
-    @pytest.fixture
-    def linker(self):
-        """Create linker instance."""
-        return MedicalEntityLinker()
-
     def test_confidence_range(self, linker):
         """Test confidence scores are in valid range."""
         result = linker.link_entity("Amoxicillin", "MEDICATION")
@@ -14,16 +14,6 @@ from src.core.exceptions import ModelLoadingError, EntityExtractionError
 class TestMedicalNER:
     """Test Medical Named Entity Recognizer."""
 
-    @pytest.fixture
-    def ner(self):
-        """Initialize NER for testing."""
-        # Note: In real tests, you'd use a mock model
-        # For now, we'll test the logic
-        try:
-            return MedicalNER(model_name="en_core_sci_md")
-        except ModelLoadingError:
-            pytest.skip("spaCy model not available")
-
     def test_ner_initialization(self):
         """Test NER can be initialized."""
         try:
@@ -33,37 +23,39 @@ class TestMedicalNER:
             pytest.skip("spaCy model not available")
 
     def test_dosage_pattern_extraction(self):
-        """Test dosage extraction with regex."""
-        ner = MedicalNER.__new__(MedicalNER)
-        ner._init_patterns()
-        
+        """Test dosage extraction with the class-level compiled regex."""
         text = "Take 500mg twice daily"
-        matches = list(ner.dosage_regex.finditer(text))
-        
+        matches = list(MedicalNER._DOSAGE_RE.finditer(text))
+
         assert len(matches) > 0
         assert "500mg" in text[matches[0].start():matches[0].end()]
 
     def test_price_pattern_extraction(self):
-        """Test price extraction with regex."""
-        ner = MedicalNER.__new__(MedicalNER)
-        ner._init_patterns()
-        
+        """Test price extraction with the class-level compiled regex."""
         text = "Price: 50 ETB"
-        matches = list(ner.price_regex.finditer(text))
-        
+        matches = list(MedicalNER._PRICE_RE.finditer(text))
+
         assert len(matches) > 0
         assert "50 ETB" in text[matches[0].start():matches[0].end()]
 
     def test_frequency_pattern_extraction(self):
         """Test frequency pattern extraction."""
-        ner = MedicalNER.__new__(MedicalNER)
-        ner._init_patterns()
-        
         text = "Take twice daily"
-        matches = list(ner.frequency_regex.finditer(text))
-        
+        matches = list(MedicalNER._FREQUENCY_RE.finditer(text))
+
         assert len(matches) > 0
 
+    def test_combined_pattern_single_pass(self):
+        """Test one finditer pass surfaces all three pattern kinds."""
+        ner = MedicalNER.__new__(MedicalNER)
+
+        text = "Take 500mg twice daily, price 50 ETB"
+        kinds = [kind for kind, _ in ner.extract_patterns(text)]
+
+        assert "DOSAGE" in kinds
+        assert "PRICE" in kinds
+        assert "FREQUENCY" in kinds
+
     def test_medical_entity_structure(self):
         """Test MedicalEntity data structure."""
         entity = MedicalEntity(
@@ -95,13 +87,89 @@ class TestMedicalNER:
         ]
         
         deduped = ner._deduplicate_entities(entities)
-        
+
         # Should keep only non-overlapping entities
         assert len(deduped) <= len(entities)
         # First entity should be kept (highest confidence in overlap)
         assert deduped[0].text == "test"
         assert deduped[0].confidence == 0.9
 
+    def test_entity_deduplication_scaling(self):
+        """Test deduplication on a large overlapping entity list."""
+        ner = MedicalNER.__new__(MedicalNER)
+
+        # 1000 entities, two overlapping candidates per span
+        entities = []
+        for i in range(500):
+            start = i * 10
+            entities.append(
+                MedicalEntity(f"e{i}", "TYPE1", start, start + 5, 0.9)
+            )
+            entities.append(
+                MedicalEntity(f"e{i}x", "TYPE2", start, start + 5, 0.8)
+            )
+
+        deduped = ner._deduplicate_entities(entities)
+
+        assert len(deduped) == 500
+        assert all(e.confidence == 0.9 for e in deduped)
+        # Contract: results come back ordered by start position
+        starts = [e.start_char for e in deduped]
+        assert starts == sorted(starts)
+
+    def test_dedup_kernel_matches_python(self):
+        """Test the sweep kernel agrees with a reference loop on fuzz."""
+        import random
+
+        import numpy as np
+
+        from src.nlp._dedup import sweep
+
+        rng = random.Random(42)
+        n = 10_000
+        starts = np.array(
+            sorted(rng.randrange(0, 50_000) for _ in range(n)), dtype=np.int64
+        )
+        ends = starts + np.array(
+            [rng.randrange(1, 30) for _ in range(n)], dtype=np.int64
+        )
+
+        expected = []
+        last_end = -1
+        for i in range(n):
+            if starts[i] >= last_end:
+                expected.append(i)
+                last_end = max(last_end, int(ends[i]))
+
+        assert list(sweep(starts, ends)) == expected
+
+    @pytest.mark.serial
+    def test_dedup_kernel_compiled_faster(self):
+        """Test the compiled sweep beats the interpreted loop."""
+        import time
+
+        import numpy as np
+
+        from src.nlp._dedup import NUMBA_AVAILABLE, _sweep_py, sweep
+
+        if not NUMBA_AVAILABLE:
+            pytest.skip("numba not available")
+
+        n = 200_000
+        starts = np.arange(n, dtype=np.int64) * 3
+        ends = starts + 5
+
+        sweep(starts, ends)  # warm
+        start_time = time.perf_counter()
+        sweep(starts, ends)
+        compiled = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        _sweep_py(starts, ends)
+        interpreted = time.perf_counter() - start_time
+
+        assert compiled < interpreted
+
     def test_entity_type_mapping(self):
         """Test entity type mapping."""
         ner = MedicalNER.__new__(MedicalNER)
@@ -125,27 +193,23 @@ class TestMedicalNER:
         assert len(medications) == 2
         assert all(e.entity_type == "MEDICATION" for e in medications)
 
-    def test_extract_medications(self, sample_medical_text):
-        """Test medication extraction."""
-        try:
-            ner = MedicalNER()
-            medications = ner.extract_medications(sample_medical_text)
-            
-            # Should find at least medication mentions
-            assert len(medications) >= 0
-        except ModelLoadingError:
-            pytest.skip("spaCy model not available")
+    @pytest.mark.serial
+    def test_extract_medications(self, ner, sample_doc):
+        """Test medication extraction from the shared parsed Doc."""
+        medications = ner.extract_medications(sample_doc)
 
-    def test_extract_conditions(self, sample_medical_text):
-        """Test condition extraction."""
-        try:
-            ner = MedicalNER()
-            conditions = ner.extract_conditions(sample_medical_text)
-            
-            # Should find conditions
-            assert len(conditions) >= 0
-        except ModelLoadingError:
-            pytest.skip("spaCy model not available")
+        # Should find at least medication mentions
+        assert len(medications) >= 0
+        assert all(e.entity_type == "MEDICATION" for e in medications)
+
+    @pytest.mark.serial
+    def test_extract_conditions(self, ner, sample_doc):
+        """Test condition extraction from the shared parsed Doc."""
+        conditions = ner.extract_conditions(sample_doc)
+
+        # Should find conditions
+        assert len(conditions) >= 0
+        assert all(e.entity_type == "CONDITION" for e in conditions)
 
     def test_empty_text_handling(self):
         """Test handling of empty text."""
@@ -158,18 +222,20 @@ class TestMedicalNER:
         except ModelLoadingError:
             pytest.skip("spaCy model not available")
 
-    def test_very_long_text_handling(self):
-        """Test handling of very long text."""
-        try:
-            ner = NER()
-            long_text = "test " * 10000  # Very long text
-            
-            # Should not crash
-            entities = ner.extract_entities(long_text)
-            assert isinstance(entities, list)
-        except ModelLoadingError:
-            pytest.skip("spaCy model not available")
+    @pytest.mark.serial
+    def test_very_long_text_handling(self, ner):
+        """Test handling of very long input as streamed chunks.
+
+        Feeding sentence-sized chunks through the streaming API bounds
+        the working set instead of building one 10k-token Doc.
+        """
+        chunks = ["test test test test test"] * 2000
+
+        # Should not crash
+        entities = list(ner.extract_entities_stream(chunks))
+        assert isinstance(entities, list)
 
+    @pytest.mark.serial
     def test_special_characters_handling(self):
         """Test handling of special characters."""
         try:
@@ -184,16 +250,13 @@ class TestMedicalNER:
 
     def test_case_insensitivity(self):
         """Test case insensitive extraction."""
-        ner = MedicalNER.__new__(MedicalNER)
-        ner._init_patterns()
-        
         # Dosage patterns should work with different cases
         texts = ["500MG", "500mg", "500Mg", "500mG"]
-        
+
         for text in texts:
-            matches = list(ner.dosage_regex.finditer(text, flags=ner.dosage_regex.flags))
-            # Pattern is case-insensitive
-            assert len(matches) > 0 or len(matches) == 0  # Depends on regex
+            matches = list(MedicalNER._DOSAGE_RE.finditer(text))
+            # Pattern is compiled with re.IGNORECASE
+            assert len(matches) == 1
 
     def test_duplicate_entity_removal(self):
         """Test that duplicate entities are removed."""
@@ -205,9 +268,10 @@ class TestMedicalNER:
         ]
         
         deduped = ner._deduplicate_entities(entities)
-        
-        # Duplicates should be removed or consolidated
-        assert len(deduped) <= len(entities)
+
+        # Exact duplicates are dropped by the pre-sweep set pass
+        assert len(deduped) == 1
+        assert deduped[0].text == "Amoxicillin"
 
     def test_confidence_score_normalization(self):
         """Test that confidence scores are normalized."""
@@ -268,6 +332,13 @@ class TestMedicalEntityClass:
         
         assert entity.normalized == "Amoxicillin"
 
+    def test_entity_slots(self):
+        """Test entities stay slotted (no per-instance __dict__)."""
+        entity = MedicalEntity("Aspirin", "MEDICATION", 0, 7, 0.92)
+
+        assert getattr(MedicalEntity, "__slots__", None) is not None
+        assert not hasattr(entity, "__dict__")
+
     def test_entity_to_dict(self):
         """Test conversion to dictionary."""
         entity = MedicalEntity(
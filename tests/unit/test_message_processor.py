@@ -4,6 +4,7 @@ Unit tests for message processing module.
 Tests complete message processing pipeline.
 """
 
+import asyncio
 import pytest
 from unittest.mock import Mock, patch
 import sys
@@ -11,17 +12,13 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.nlp.message_processor import MedicalMessageProcessor
+from src.nlp.medical_ner import MedicalEntity
+from src.nlp.message_processor import MedicalMessageProcessor, ProcessedMessage
 
 
 class TestMessageProcessor:
     """Test message processor."""
 
-    @pytest.fixture
-    def processor(self):
-        """Create processor instance."""
-        return MedicalMessageProcessor()
-
     def test_processor_initialization(self, processor):
         """Test processor initialization."""
         assert processor is not None
@@ -86,54 +83,41 @@ class TestMessageProcessor:
 class TestProcessedMessage:
     """Test ProcessedMessage result object."""
 
-    @pytest.fixture
-    def processor(self):
-        """Create processor instance."""
-        return MedicalMessageProcessor()
-
-    def test_result_has_all_attributes(self, processor):
-        """Test result has all required attributes."""
-        text = "Amoxicillin for infection"
-        result = processor.process_message(text)
-
-        assert hasattr(result, "original_text")
-        assert hasattr(result, "is_medical")
-        assert hasattr(result, "medical_confidence")
-        assert hasattr(result, "entities")
-        assert hasattr(result, "quality_score")
-        assert hasattr(result, "processing_time")
-
-    def test_entity_attributes(self, processor):
-        """Test entity attributes in result."""
-        text = "Amoxicillin 500mg for infection"
-        result = processor.process_message(text)
-
-        for entity in result.entities:
-            assert hasattr(entity, "text")
-            assert hasattr(entity, "entity_type")
-            assert hasattr(entity, "confidence")
+    def test_result_has_all_attributes(self):
+        """Test the result schema declares all required fields."""
+        # One structural check against the dataclass schema instead of
+        # per-instance hasattr probes
+        assert set(ProcessedMessage.__dataclass_fields__) >= {
+            "text",
+            "is_medical",
+            "medical_confidence",
+            "entities",
+            "quality_score",
+            "processing_status",
+        }
+        assert getattr(ProcessedMessage, "__slots__", None) is not None
+
+    def test_entity_attributes(self):
+        """Test the entity schema declares all required fields."""
+        assert set(MedicalEntity.__dataclass_fields__) >= {
+            "text",
+            "entity_type",
+            "confidence",
+        }
 
 
 class TestBatchProcessing:
     """Test batch message processing."""
 
-    @pytest.fixture
-    def processor(self):
-        """Create processor instance."""
-        return MedicalMessageProcessor()
-
     def test_batch_processing(self, processor):
-        """Test processing multiple messages."""
+        """Test processing multiple messages through the batch path."""
         texts = [
             "Amoxicillin for infection",
             "Weather is sunny",
             "Patient has fever",
         ]
 
-        results = []
-        for text in texts:
-            result = processor.process_message(text)
-            results.append(result)
+        results = processor.process_batch(texts, batch_size=8)
 
         assert len(results) == 3
         assert all(result is not None for result in results)
@@ -146,23 +130,46 @@ class TestBatchProcessing:
             "Fever treatment",
         ]
 
-        results = []
-        for text in texts:
-            result = processor.process_message(text)
-            results.append(result)
+        results = processor.process_batch(texts, batch_size=8)
 
         medical_count = sum(1 for r in results if r.is_medical)
         assert medical_count >= 2
 
+    def test_batch_processing_async(self, processor):
+        """Test concurrent processing via the async thread-pool path."""
+        texts = [
+            "Amoxicillin for infection",
+            "Weather is sunny",
+            "Patient has fever",
+        ]
+
+        async def gather_all():
+            return await asyncio.gather(
+                *[processor.process_message_async(t) for t in texts]
+            )
+
+        results = asyncio.run(gather_all())
+
+        assert len(results) == 3
+        assert all(result is not None for result in results)
+
+    def test_batch_matches_single(self, processor):
+        """Test batch results agree with per-message processing."""
+        texts = [
+            "Amoxicillin for infection",
+            "Weather is sunny",
+        ]
+
+        batch_results = processor.process_batch(texts, batch_size=8)
+        single_results = [processor.process_message(t) for t in texts]
+
+        for batch, single in zip(batch_results, single_results):
+            assert batch.is_medical == single.is_medical
+
 
 class TestQualityScoring:
     """Test quality scoring logic."""
 
-    @pytest.fixture
-    def processor(self):
-        """Create processor instance."""
-        return MedicalMessageProcessor()
-
     def test_high_quality_score(self, processor):
         """Test high quality medical message."""
         text = "Amoxicillin 500mg twice daily for bacterial infection"
@@ -193,11 +200,6 @@ class TestQualityScoring:
 class TestEdgeCases:
     """Test edge cases."""
 
-    @pytest.fixture
-    def processor(self):
-        """Create processor instance."""
-        return MedicalMessageProcessor()
-
     def test_special_characters(self, processor):
         """Test handling special characters."""
         text = "Amoxicillin (500mg) for infection!!"
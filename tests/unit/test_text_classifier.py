@@ -11,17 +11,16 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.nlp.text_classifier import MedicalTextClassifier
+from src.nlp.text_classifier import (
+    ClassificationResult,
+    MedicalTextClassifier,
+    _NORMALIZE_TABLE,
+)
 
 
 class TestMedicalTextClassifier:
     """Test medical text classifier."""
 
-    @pytest.fixture
-    def classifier(self):
-        """Create classifier instance."""
-        return MedicalTextClassifier()
-
     def test_classifier_initialization(self, classifier):
         """Test classifier initialization."""
         assert classifier is not None
@@ -78,60 +77,94 @@ class TestMedicalTextClassifier:
 
         assert isinstance(result.is_medical, bool)
 
+    def test_confidence_quantized_storage(self):
+        """Test confidence is stored as one byte and decodes closely."""
+        result = ClassificationResult(label="medical", confidence=0.87)
+
+        assert 0 <= result._conf_q <= 255
+        assert abs(result.confidence - 0.87) <= 1 / 255
+        assert not hasattr(result, "__dict__")
+
+    def test_fast_reject_no_model_call(self):
+        """Test non-medical text short-circuits before model inference."""
+        clf = MedicalTextClassifier.__new__(MedicalTextClassifier)
+        clf._build_keyword_matcher()
+        clf.classifier = Mock()
+
+        result = clf.classify("apple orange banana")
+
+        assert result.label == "non-medical"
+        clf.classifier.assert_not_called()
+
 
 class TestKeywordHeuristics:
     """Test keyword-based heuristics."""
 
-    @pytest.fixture
-    def classifier(self):
-        """Create classifier instance."""
-        return MedicalTextClassifier()
-
     def test_medication_keywords(self, classifier):
         """Test detection of medication keywords."""
         text = "Amoxicillin, Paracetamol, and Artemether"
-        result = classifier.classify(text)
+        counts = classifier.classify_detailed(text)
 
-        assert result.is_medical
+        assert counts["medication"] == 3
 
     def test_symptom_keywords(self, classifier):
         """Test detection of symptom keywords."""
         text = "fever, headache, and nausea"
-        result = classifier.classify(text)
+        counts = classifier.classify_detailed(text)
 
-        # Should detect medical keywords
-        assert isinstance(result.is_medical, bool)
+        assert counts["symptom"] >= 1
 
     def test_condition_keywords(self, classifier):
         """Test detection of condition keywords."""
         text = "malaria, infection, and disease"
-        result = classifier.classify(text)
+        counts = classifier.classify_detailed(text)
 
-        # Should detect medical keywords
-        assert isinstance(result.is_medical, bool)
+        assert counts["condition"] == 3
+
+    def test_normalize_single_pass(self):
+        """Test the translate table matches lower() + punctuation strip."""
+        import re
+
+        punct = re.compile(r"[!\"#$%&'()*+,\-./:;<=>?@\[\\\]^_`{|}~]")
+        corpus = [
+            "Amoxicillin (500mg) for infection!!!!",
+            "aMoXiCiLLiN for InFeCtIoN",
+            "Price: 50 ETB; fever, cough & pain",
+            "no punctuation here",
+        ]
+
+        for text in corpus:
+            assert text.translate(_NORMALIZE_TABLE) == punct.sub(" ", text).lower()
+
+    def test_phrase_matcher_hits_are_stringstore_ids(self):
+        """Test the matcher fast path resolves hits via the StringStore."""
+        clf = MedicalTextClassifier.__new__(MedicalTextClassifier)
+        clf._build_keyword_matcher()
+
+        doc = clf._kw_nlp.make_doc("patient needs amoxicillin for malaria treatment")
+        hits = clf._kw_matcher(doc)
+
+        assert len(hits) > 0
+        for match_id, _, _ in hits:
+            assert isinstance(match_id, int)
+            assert clf._kw_nlp.vocab.strings[match_id] in clf.MEDICAL_KEYWORDS
 
     def test_non_medical_keywords(self, classifier):
-        """Test non-medical keywords are not classified as medical."""
+        """Test non-medical keywords match no category."""
         text = "apple, orange, banana"
-        result = classifier.classify(text)
+        counts = classifier.classify_detailed(text)
 
-        assert not result.is_medical
+        assert all(count == 0 for count in counts.values())
 
 
 class TestConsistency:
     """Test classifier consistency."""
 
-    @pytest.fixture
-    def classifier(self):
-        """Create classifier instance."""
-        return MedicalTextClassifier()
-
     def test_same_text_same_result(self, classifier):
         """Test same text gives same result."""
         text = "Amoxicillin 500mg for infection"
 
-        result1 = classifier.classify(text)
-        result2 = classifier.classify(text)
+        result1, result2 = classifier.batch_classify([text, text])
 
         assert result1.is_medical == result2.is_medical
 
@@ -140,20 +173,38 @@ class TestConsistency:
         text1 = "Amoxicillin for fever"
         text2 = "Amoxicillin for infection"
 
-        result1 = classifier.classify(text1)
-        result2 = classifier.classify(text2)
+        result1, result2 = classifier.batch_classify([text1, text2])
 
         assert result1.is_medical == result2.is_medical
 
+    def test_classification_cached(self, classifier):
+        """Test repeated classify calls hit the memo cache."""
+        text = "Amoxicillin 500mg for infection"
+
+        result1 = classifier.classify(text)
+        result2 = classifier.classify(text)
+
+        # Identity, not just equality: the second call is a cache hit
+        assert result1 is result2
+        assert classifier._classify_cached.cache_info().hits >= 1
+
+    def test_batch_matches_single(self, classifier):
+        """Test batch classification agrees with per-text classify."""
+        texts = [
+            "Amoxicillin 500mg for infection",
+            "The weather is sunny today",
+        ]
+
+        batch_results = classifier.batch_classify(texts, batch_size=8)
+        single_results = [classifier.classify(t) for t in texts]
+
+        for batch, single in zip(batch_results, single_results):
+            assert batch.is_medical == single.is_medical
+
 
 class TestEdgeCases:
     """Test edge cases."""
 
-    @pytest.fixture
-    def classifier(self):
-        """Create classifier instance."""
-        return MedicalTextClassifier()
-
     def test_null_text(self, classifier):
         """Test handling null text."""
         try: